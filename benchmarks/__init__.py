@@ -0,0 +1,8 @@
+"""Offline benchmark suite for ansi-colors.
+
+    python -m benchmarks run -o baseline.json
+    python -m benchmarks run --compare baseline.json
+    python -m benchmarks compare baseline.json current.json
+
+Thread scaling is measured separately by ``python benchmarks/threaded.py``.
+"""
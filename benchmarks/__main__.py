@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import sys
+from typing import Dict, List, Optional
+
+from benchmarks import harness
+
+
+def _run(args: argparse.Namespace) -> int:
+    from benchmarks.suite import benchmarks
+
+    results: Dict[str, harness.Result] = {}
+    for case in benchmarks():
+        if args.filter and not any(fnmatch.fnmatch(case.name, p) for p in args.filter):
+            continue
+        result = case.run()
+        results[case.name] = result
+        print(
+            f"{case.name:<36} {harness.format_time(result['median']):>12} "
+            f"(min {harness.format_time(result['min'])}, "
+            f"{result['number']} x {result['repeat']})",
+            flush=True,
+        )
+    if args.output:
+        harness.save(args.output, results)
+        print(f"Saved results to {args.output}")
+    if args.compare:
+        return _report(harness.load(args.compare), results, args.threshold)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    return _report(
+        harness.load(args.baseline), harness.load(args.current), args.threshold
+    )
+
+
+def _report(
+    baseline: Dict[str, harness.Result],
+    current: Dict[str, harness.Result],
+    threshold: float,
+) -> int:
+    lines, regressions = harness.compare(baseline, current, threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {threshold:.0%}.")
+        return 1
+    print(f"No regressions beyond {threshold:.0%}.")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the suite")
+    run.add_argument("-o", "--output", help="Save results as JSON to this path")
+    run.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        metavar="GLOB",
+        help="Only run benchmarks whose name matches GLOB (repeatable)",
+    )
+    run.add_argument("--compare", metavar="BASELINE", help="Compare against a baseline")
+    run.set_defaults(func=_run)
+
+    compare = commands.add_parser("compare", help="Compare two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.set_defaults(func=_compare)
+
+    for sub in (run, compare):
+        sub.add_argument(
+            "--threshold",
+            type=float,
+            default=harness.DEFAULT_THRESHOLD,
+            help="Slowdown (as a fraction) that counts as a regression",
+        )
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Timing, result files and regression comparison for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+Result = Dict[str, float]
+
+DEFAULT_REPEAT = 7
+DEFAULT_THRESHOLD = 0.10
+
+
+class Benchmark:
+    """A named callable timed in seconds per call.
+
+    ``number`` fixes how many calls make up one measurement; when it is
+    ``None`` it is picked with ``timeit``'s autorange so every measurement
+    takes at least 0.2 seconds. ``setup`` and ``teardown`` run once around
+    all measurements and are not timed.
+    """
+
+    name: str
+    func: Callable[[], object]
+    number: Optional[int]
+    repeat: int
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], object],
+        number: Optional[int] = None,
+        repeat: int = DEFAULT_REPEAT,
+        setup: Optional[Callable[[], object]] = None,
+        teardown: Optional[Callable[[], object]] = None,
+    ):
+        self.name = name
+        self.func = func
+        self.number = number
+        self.repeat = repeat
+        self.setup = setup
+        self.teardown = teardown
+
+    def run(self) -> Result:
+        if self.setup is not None:
+            self.setup()
+        try:
+            timer = timeit.Timer(self.func)
+            number = self.number
+            if number is None:
+                number, _ = timer.autorange()
+            times = timer.repeat(repeat=self.repeat, number=number)
+        finally:
+            if self.teardown is not None:
+                self.teardown()
+        samples = [t / number for t in times]
+        return {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.fmean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "number": number,
+            "repeat": self.repeat,
+        }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def metadata() -> Dict[str, Optional[str]]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def save(path: str, results: Dict[str, Result]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": metadata(), "results": results}, f, indent=2)
+        f.write("\n")
+
+
+def load(path: str) -> Dict[str, Result]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(
+    baseline: Dict[str, Result],
+    current: Dict[str, Result],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Tuple[List[str], List[str]]:
+    """Compare medians and return ``(report lines, regressed benchmark names)``.
+
+    A benchmark regresses when its median is more than ``threshold`` (a
+    fraction) slower than the baseline. Benchmarks missing from ``current``,
+    e.g. because of a filter, are ignored.
+    """
+    lines = [f"{'benchmark':<36} {'baseline':>12} {'current':>12} {'change':>9}"]
+    regressions: List[str] = []
+    for name in current:
+        if name not in baseline:
+            new = format_time(current[name]["median"])
+            lines.append(f"{name:<36} {'-':>12} {new:>12}  (new)")
+            continue
+        old = baseline[name]["median"]
+        new = current[name]["median"]
+        change = (new - old) / old if old else 0.0
+        status = ""
+        if change > threshold:
+            status = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "  improved"
+        lines.append(
+            f"{name:<36} {format_time(old):>12} {format_time(new):>12} "
+            f"{change:>+8.1%}{status}"
+        )
+    return lines, regressions
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
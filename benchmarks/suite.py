@@ -0,0 +1,197 @@
+"""The benchmark cases.
+
+Every case is timed per call of its function; the loop-based cases report
+the time for a whole sweep (all 256 indices, 1024 RGB triples) so results
+stay comparable when the inner work changes.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Callable, Dict, List
+
+# Force the full encoding path; detection is cached on first use.
+os.environ.setdefault("COLORTERM", "truecolor")
+
+from ansi_colors.codes import (  # noqa: E402
+    FULL_FOREGROUND_COLOR,
+    RGB_FOREGROUND_COLOR,
+    TEXT_STYLES,
+    AnsiCodes,
+)
+from ansi_colors.columns import PALETTES, ColumnStyler, colorize_columns  # noqa: E402
+from ansi_colors.image import Netpbm, render_image  # noqa: E402
+from ansi_colors.support import supports_color  # noqa: E402
+from ansi_colors.theme import CACHE_ENV, load_theme  # noqa: E402
+
+from benchmarks.harness import Benchmark  # noqa: E402
+
+RGB_SAMPLES = 1024
+IMAGE_SIZE = (200, 200)
+THEME_STYLES = 100
+TABLE_ROWS = 10000
+TABLE_STATUSES = ("Running", "Pending", "Error", "Completed")
+COLD_START_RUNS = 10
+
+# Environment variables that drive `supports_color()`, per scenario.
+DETECTION_ENVS: Dict[str, Dict[str, str]] = {
+    "truecolor": {"COLORTERM": "truecolor"},
+    "term_program": {"TERM_PROGRAM": "WezTerm"},
+    "term_program_re": {"TERM_PROGRAM": "gnome-terminal"},
+    "term_256": {"TERM": "xterm-256color", "WT_SESSION": "1"},
+    "term_vte": {"TERM": "vte-256color"},
+    "unknown": {"TERM": "dumb"},
+}
+DETECTION_KEYS = ("COLORTERM", "TERM_PROGRAM", "TERM", "WT_SESSION")
+
+# `supports_color` is memoised; time the detection itself.
+_detect = supports_color.__wrapped__  # type: ignore[attr-defined]
+
+
+def _rgb_triples() -> List[tuple]:
+    rng = random.Random(0)
+    return [
+        (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        for _ in range(RGB_SAMPLES)
+    ]
+
+
+def _gradient_ppm() -> bytes:
+    """A PPM whose every pixel differs from its neighbours."""
+    width, height = IMAGE_SIZE
+    header = f"P6 {width} {height} 255\n".encode()
+    return header + bytes(
+        value
+        for y in range(height)
+        for x in range(width)
+        for value in (x * 255 // width, y * 255 // height, (x * y) & 0xFF)
+    )
+
+
+def _table_lines() -> List[str]:
+    rng = random.Random(0)
+    lines = ["id,name,status,count,ratio\n"]
+    for i in range(TABLE_ROWS):
+        status = rng.choice(TABLE_STATUSES)
+        lines.append(
+            f"{i},name-{rng.randrange(10**6)},{status},"
+            f"{rng.randrange(1000)},{rng.random():.4f}\n"
+        )
+    return lines
+
+
+def _render_columns(lines: List[str], styler: ColumnStyler) -> None:
+    colorize_columns(lines, io.StringIO(), styler, header=True)
+
+
+def _render_image(data: bytes, truecolor: bool) -> None:
+    image = Netpbm(io.BytesIO(data))
+    for _ in render_image(image, IMAGE_SIZE[0], truecolor):
+        pass
+
+
+def _theme_load(name: str, use_cache: bool) -> Benchmark:
+    state: Dict[str, str] = {}
+
+    def setup() -> None:
+        directory = state["dir"] = tempfile.mkdtemp(prefix="ansi-colors-bench-")
+        state["saved"] = os.environ.get(CACHE_ENV, "")
+        os.environ[CACHE_ENV] = directory
+        rng = random.Random(0)
+        path = state["path"] = os.path.join(directory, "theme.toml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[styles]\n")
+            for i in range(THEME_STYLES):
+                color = rng.randrange(1 << 24)
+                f.write(f'style{i} = "bold fg:#{color:06x} bg:full:{i}"\n')
+
+    def teardown() -> None:
+        if state["saved"]:
+            os.environ[CACHE_ENV] = state["saved"]
+        else:
+            os.environ.pop(CACHE_ENV, None)
+        shutil.rmtree(state["dir"], ignore_errors=True)
+
+    return Benchmark(
+        name,
+        lambda: load_theme(state["path"], use_cache=use_cache),
+        setup=setup,
+        teardown=teardown,
+    )
+
+
+def _detection(name: str, env: Dict[str, str]) -> Benchmark:
+    saved: Dict[str, str] = {}
+
+    def setup() -> None:
+        for key in DETECTION_KEYS:
+            if key in os.environ:
+                saved[key] = os.environ.pop(key)
+        os.environ.update(env)
+
+    def teardown() -> None:
+        for key in DETECTION_KEYS:
+            os.environ.pop(key, None)
+        os.environ.update(saved)
+
+    return Benchmark(name, _detect, setup=setup, teardown=teardown)
+
+
+def _cold_start() -> None:
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from ansi_colors.cli import main; main()",
+            "fg",
+            "base",
+            "red",
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def benchmarks() -> List[Benchmark]:
+    triples = _rgb_triples()
+    codes = AnsiCodes()
+    full = FULL_FOREGROUND_COLOR
+    rgb = RGB_FOREGROUND_COLOR
+    bold = TEXT_STYLES.bold
+    indices = range(256)
+
+    cases: Dict[str, Callable[[], object]] = {
+        "showcode.to_ansi": bold.to_ansi,
+        "full.code[0-255]": lambda: [full.code(i) for i in indices],
+        "full.to_ansi[0-255]": lambda: [full.to_ansi(i) for i in indices],
+        "rgb.to_ansi[1024 random]": lambda: [rgb.to_ansi(c) for c in triples],
+        "ansi_codes.show_all": codes.show_all,
+    }
+    ppm = _gradient_ppm()
+    cases["image.render[200x100 truecolor]"] = lambda: _render_image(ppm, True)
+    cases["image.render[200x100 256]"] = lambda: _render_image(ppm, False)
+    table = _table_lines()
+    palette = ColumnStyler(PALETTES["base"])
+    rules = ColumnStyler.parse(PALETTES["base"], ["Error=bold red", "Running=green"])
+    cases["columns.render[10k csv rows]"] = lambda: _render_columns(table, palette)
+    cases["columns.render[10k csv rows, rules]"] = lambda: _render_columns(table, rules)
+    suite = [Benchmark(name, func) for name, func in cases.items()]
+    suite.append(_theme_load(f"theme.load[{THEME_STYLES} cached]", True))
+    suite.append(_theme_load(f"theme.load[{THEME_STYLES} uncached]", False))
+    for scenario, env in DETECTION_ENVS.items():
+        suite.append(_detection(f"supports_color[{scenario}]", env))
+    suite.append(
+        Benchmark(
+            "cli.cold_start[fg base red]",
+            _cold_start,
+            number=1,
+            repeat=COLD_START_RUNS,
+        )
+    )
+    return suite
@@ -0,0 +1,94 @@
+"""Measure how rendering throughput scales with threads.
+
+Every thread performs the same fixed amount of work (weak scaling), so on a
+free-threaded build (e.g. CPython 3.13t) with enough cores the aggregate
+throughput should grow linearly with the thread count. With the GIL it stays
+flat.
+
+    python benchmarks/threaded.py --threads 1,2,4,8 --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import List
+
+os.environ.setdefault("COLORTERM", "truecolor")
+
+from ansi_colors.codes import (  # noqa: E402
+    FOREGROUND_COLORS,
+    FULL_FOREGROUND_COLOR,
+    RGB_FOREGROUND_COLOR,
+    TEXT_STYLES,
+)
+from ansi_colors.markup import compile_markup  # noqa: E402
+
+TEMPLATE = "[bold red]{level}[/] [dim]{ts}[/] {msg} [#ff8800]{ms}ms[/]"
+COLOR_NAMES = tuple(FOREGROUND_COLORS.table_attrs.values())
+
+
+def work(iterations: int) -> int:
+    template = compile_markup(TEMPLATE)
+    emitted = 0
+    for i in range(iterations):
+        index = i & 0xFF
+        parts = [
+            FULL_FOREGROUND_COLOR.to_ansi(index),
+            RGB_FOREGROUND_COLOR.to_ansi((index, 255 - index, i % 7)),
+            FOREGROUND_COLORS.to_ansi(COLOR_NAMES[i & 7]),
+            TEXT_STYLES.to_ansi("bold"),
+            template.render(level="ERROR", ts=i, msg="request failed", ms=index),
+        ]
+        emitted += len("".join(parts))
+    return emitted
+
+
+def run(threads: int, iterations: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def target() -> None:
+        barrier.wait()
+        work(iterations)
+
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(
+        f"{'threads':>8} {'seconds':>9} {'ops/s':>12} {'speedup':>8} {'efficiency':>10}"
+    )
+    work(1000)
+    baseline = None
+    for threads in [int(n) for n in args.threads.split(",")]:
+        elapsed = run(threads, args.iterations)
+        throughput = threads * args.iterations / elapsed
+        if baseline is None:
+            baseline = throughput / threads
+        speedup = throughput / baseline
+        print(
+            f"{threads:>8} {elapsed:>9.3f} {throughput:>12,.0f} "
+            f"{speedup:>7.2f}x {speedup / threads:>9.0%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
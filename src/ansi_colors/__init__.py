@@ -1,3 +1,6 @@
+from . import profiling
 from . import cli, codes
 
-__all__ = ["cli", "codes"]
+profiling.mark_imported()
+
+__all__ = ["cli", "codes", "profiling"]
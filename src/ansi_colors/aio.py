@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import List, Optional, Tuple, Union
+import asyncio
+import os
+from ansi_colors.codes import RESET_CODE, ShowCode
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+Code = Union[ShowCode, str]
+
+
+# asyncio has no public write-side stream protocol, so this relies on two
+# CPython internals (present in 3.8 to 3.13): FlowControlMixin, which
+# implements drain(), and the _get_close_waiter hook that
+# StreamWriter.wait_closed() calls. Re-check both on new Python releases.
+class _PipeProtocol(asyncio.streams.FlowControlMixin):
+    """Write-side protocol for pipes, with the close waiter StreamWriter needs."""
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        super().__init__(loop)
+        self._closed = self._loop.create_future()
+
+    def connection_lost(self, exc: Optional[BaseException]) -> None:
+        super().connection_lost(exc)
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def _get_close_waiter(self, stream: asyncio.StreamWriter) -> asyncio.Future:
+        return self._closed
+
+
+class Span:
+    """A piece of text and the codes to style it with.
+
+    Codes are :class:`ShowCode` objects or escape sequences returned by the
+    ``to_ansi`` methods of the code tables. The styled bytes are built once,
+    so a span can be written any number of times.
+    """
+
+    __slots__ = ("text", "data")
+
+    text: str
+    data: str
+
+    def __init__(self, text: str, *codes: Code):
+        self.text = text
+        prefix = "".join(
+            code.to_ansi() if isinstance(code, ShowCode) else code for code in codes
+        )
+        self.data = f"{prefix}{text}{RESET_CODE.to_ansi()}" if prefix else text
+
+    def __str__(self) -> str:
+        return self.data
+
+    def __repr__(self) -> str:
+        return f"Span({self.text!r})"
+
+
+class AsyncColorWriter:
+    """Buffer styled output and write it to an asyncio stream.
+
+    :meth:`write` only appends to an in-memory buffer and never blocks.
+    :meth:`emit` writes as well, and once ``buffer_size`` bytes are pending
+    hands them to the transport in a single write and awaits ``drain()`` so a
+    slow TTY or pty pushes back on the producer instead of growing memory.
+    """
+
+    writer: asyncio.StreamWriter
+    buffer_size: int
+    encoding: str
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        encoding: str = "utf-8",
+    ):
+        self.writer = writer
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self._buffer: List[bytes] = []
+        self._pending = 0
+        # The fd from_fd() made non-blocking, and its original blocking mode.
+        self._fd_mode: Optional[Tuple[int, bool]] = None
+
+    @classmethod
+    async def from_fd(
+        cls,
+        fd: int,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        encoding: str = "utf-8",
+    ) -> AsyncColorWriter:
+        """Wrap a pipe, TTY or pty file descriptor.
+
+        The descriptor is switched to non-blocking mode while the writer is
+        open; :meth:`close` restores its original mode but does not close it,
+        the caller still owns it.
+        """
+        loop = asyncio.get_running_loop()
+        blocking = os.get_blocking(fd)
+        pipe = os.fdopen(fd, "wb", buffering=0, closefd=False)
+        transport, protocol = await loop.connect_write_pipe(_PipeProtocol, pipe)
+        writer = asyncio.StreamWriter(transport, protocol, None, loop)
+        color_writer = cls(writer, buffer_size, encoding)
+        color_writer._fd_mode = (fd, blocking)
+        return color_writer
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes not yet handed to the transport."""
+        return self._pending
+
+    def write(self, *items: Union[Span, str]) -> None:
+        """Buffer spans and plain strings without doing any I/O."""
+        data = "".join(
+            item.data if isinstance(item, Span) else item for item in items
+        ).encode(self.encoding)
+        self._buffer.append(data)
+        self._pending += len(data)
+
+    def span(self, text: str, *codes: Code) -> None:
+        """Buffer ``text`` styled with ``codes``."""
+        self.write(Span(text, *codes))
+
+    async def emit(self, *items: Union[Span, str]) -> None:
+        """Buffer ``items`` and flush once the buffer is full."""
+        self.write(*items)
+        if self._pending >= self.buffer_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write everything buffered and wait for the transport to drain."""
+        if self._buffer:
+            data = b"".join(self._buffer)
+            self._buffer.clear()
+            self._pending = 0
+            self.writer.write(data)
+        await self.writer.drain()
+
+    async def close(self) -> None:
+        await self.flush()
+        self.writer.close()
+        await self.writer.wait_closed()
+        if self._fd_mode is not None:
+            fd, blocking = self._fd_mode
+            self._fd_mode = None
+            os.set_blocking(fd, blocking)
+
+    async def __aenter__(self) -> AsyncColorWriter:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> Optional[bool]:
+        await self.close()
+        return None
@@ -1,18 +1,193 @@
 from __future__ import annotations
 
+import importlib
+import sys
 import typing as t
-import rich_click as click
+from functools import partial
+from click.globals import resolve_color_default
 from ansi_colors.context import (
+    BaseGroup,
     ColorContext,
+    click,
     pass_context,
     color_args,
+    index_args,
     rgb_args,
     pass_obj,
 )
+from ansi_colors import profiling
 from ansi_colors.utils import debug, get_log_level, set_log_level, LogLevel
 
+CommandFactory = t.Callable[[], click.Command]
 
-@click.group("ansi-colors", invoke_without_command=True)
+
+def _written(message: str) -> str:
+    """Return ``message`` as click.echo will write it to standard output."""
+    color = resolve_color_default()
+    if color is None:
+        color = sys.stdout.isatty()
+    return message if color else click.unstyle(message)
+
+
+def echo(message: str) -> None:
+    """Write a line to standard output, recording it when profiling."""
+    prof = profiling.ACTIVE
+    if prof is None:
+        click.echo(message)
+        return
+    with prof.time("write"):
+        click.echo(message)
+    # Count what reaches stdout: click strips escape codes when it is not a TTY.
+    prof.count("bytes_written", len(_written(message).encode()) + 1)
+
+
+class LazyGroup(BaseGroup):
+    """A group whose subcommands are only built when they are looked up.
+
+    ``lazy_commands`` maps command names to factories; a factory runs the
+    first time its command is dispatched (or listed in help) and the result
+    is registered like any other subcommand, so a single lookup only pays
+    for the commands on its path.
+    """
+
+    lazy_commands: t.Dict[str, CommandFactory]
+
+    def __init__(
+        self,
+        *args: t.Any,
+        lazy_commands: t.Optional[t.Dict[str, CommandFactory]] = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> t.List[str]:
+        return sorted({*self.commands, *self.lazy_commands})
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> t.Optional[click.Command]:
+        command = self.commands.get(cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self.lazy_commands.pop(cmd_name)()
+            self.add_command(command, cmd_name)
+        return command
+
+
+def imported(path: str) -> CommandFactory:
+    """Return a factory importing the command at ``"module:attribute"``."""
+    module_name, _, attribute = path.partition(":")
+
+    def load() -> click.Command:
+        return getattr(importlib.import_module(module_name), attribute)
+
+    return load
+
+
+def base_callback(codes: ColorContext, color: t.Optional[str]):
+    """Display base color codes"""
+    if color:
+        echo(codes.section.base.to_ansi(color))
+    else:
+        echo(codes.section.base.section().str())
+
+
+def bright_callback(codes: ColorContext, color: t.Optional[str]):
+    """Display bright color codes"""
+    if color is not None:
+        echo(codes.section.bright.to_ansi(color))
+    else:
+        echo(codes.section.bright.section().str())
+
+
+def full_callback(codes: ColorContext, index: t.Optional[int]):
+    """Display full color codes"""
+    if index is not None:
+        echo(codes.section.full.to_ansi(index))
+    else:
+        echo(codes.section.full.section().str())
+
+
+def rgb_callback(
+    codes: ColorContext,
+    red: t.Optional[t.Union[int, t.Tuple[int, int, int]]],
+    green: t.Optional[int],
+    blue: t.Optional[int],
+):
+    """Display RGB color codes"""
+    if isinstance(red, tuple):
+        if green is not None or blue is not None:
+            raise click.UsageError(
+                "GREEN and BLUE cannot be combined with a hex or HSL color."
+            )
+        echo(codes.section.rgb.to_ansi(red))
+    elif red is not None and green is not None and blue is not None:
+        echo(codes.section.rgb.to_ansi((red, green, blue)))
+    else:
+        echo(codes.section.rgb.section().str())
+
+
+# `fg` and `bg` take the same color families; each row is the command name,
+# its callback, the decorator adding its arguments and its help text.
+COLOR_FAMILIES: t.Tuple[t.Tuple[str, t.Callable, t.Callable, str], ...] = (
+    ("base", base_callback, color_args, "Display base {layer} color codes"),
+    ("bright", bright_callback, color_args, "Display bright {layer} color codes"),
+    ("full", full_callback, index_args, "Display full {layer} color codes"),
+    (
+        "rgb",
+        rgb_callback,
+        rgb_args,
+        "Display {layer} RGB color codes\n\n"
+        "Accepts RED GREEN BLUE, a hex color like '#ff8800' or 'hsl:30,100,50'.",
+    ),
+)
+# Command name -> the ColorContext section it selects.
+COLOR_LAYERS: t.Dict[str, str] = {"fg": "foreground", "bg": "background"}
+
+
+def color_family_command(
+    layer: str, name: str, callback: t.Callable, arguments: t.Callable, help: str
+) -> click.Command:
+    return click.command(name, help=help.format(layer=layer))(
+        arguments(pass_obj(callback))
+    )
+
+
+def color_layer_group(name: str) -> click.Command:
+    layer = COLOR_LAYERS[name]
+
+    @pass_context
+    def group(ctx: click.Context, codes: ColorContext):
+        debug(f"ansi-colors {name} {ctx.invoked_subcommand}")
+        ctx.obj = codes = codes.with_section(layer)
+        if ctx.invoked_subcommand is None:
+            echo(codes.section.show_all())
+
+    return LazyGroup(
+        name,
+        callback=group,
+        invoke_without_command=True,
+        help=f"Display {layer} color codes",
+        lazy_commands={
+            family[0]: partial(color_family_command, layer, *family)
+            for family in COLOR_FAMILIES
+        },
+    )
+
+
+@click.group(
+    "ansi-colors",
+    cls=LazyGroup,
+    invoke_without_command=True,
+    lazy_commands={
+        **{name: partial(color_layer_group, name) for name in COLOR_LAYERS},
+        "colorize": imported("ansi_colors.commands.colorize:colorize"),
+        "columns": imported("ansi_colors.commands.columns:columns"),
+        "export-html": imported("ansi_colors.commands.export_html:export_html"),
+        "image": imported("ansi_colors.commands.image:image"),
+        "theme": imported("ansi_colors.commands.theme:theme"),
+    },
+)
 @click.option(
     "-q",
     "--quiet",
@@ -25,14 +200,23 @@ from ansi_colors.utils import debug, get_log_level, set_log_level, LogLevel
     count=True,
     help="Increase the verbosity level",
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Report where time was spent on standard error",
+)
 @pass_context
 def main(
     ctx: click.Context,
     codes: ColorContext,
     quiet: int,
     verbose: int,
+    profile: bool,
 ):
     """ANSI Color Codes CLI Tool"""
+    if profile:
+        prof = profiling.start()
+        ctx.call_on_close(lambda: click.echo(prof.report(), err=True))
     # Start from INFO and walk the level up/down based on `-v` and `-q` counts.
     quiet = quiet or 0
     verbose = verbose or 0
@@ -42,7 +226,7 @@ def main(
     set_log_level(LogLevel(level_value))
     debug(f"ansi-colors {ctx.invoked_subcommand}")
     if ctx.invoked_subcommand is None:
-        click.echo(codes.codes.show_all())
+        echo(codes.codes.show_all())
 
 
 @main.command("styles")
@@ -70,147 +254,6 @@ def styles(codes: ColorContext, style: t.Optional[str]):
     """Display text style codes"""
     debug(f"ansi-colors styles {style}")
     if style:
-        click.echo(codes.codes.text_styles.to_ansi(style))
+        echo(codes.codes.text_styles.to_ansi(style))
     else:
-        click.echo(codes.codes.text_styles.section().str())
-
-
-@main.group("fg", invoke_without_command=True)
-@pass_context
-def fg(ctx: click.Context, codes: ColorContext):
-    """Display foreground color codes"""
-    debug(f"ansi-colors fg {ctx.invoked_subcommand}")
-    codes.section = "foreground"
-    if ctx.invoked_subcommand is None:
-        click.echo(codes.section.show_all())
-
-
-@main.group("bg", invoke_without_command=True)
-@pass_context
-def bg(ctx: click.Context, codes: ColorContext):
-    """Display background color codes"""
-    debug(f"ansi-colors bg {ctx.invoked_subcommand}")
-    codes.section = "background"
-    if ctx.invoked_subcommand is None:
-        click.echo(codes.section.show_all())
-
-
-def base_callback(codes: ColorContext, color: t.Optional[str]):
-    """Display base background color codes"""
-    if color:
-        click.echo(codes.section.base.to_ansi(color))
-    else:
-        click.echo(codes.section.base.section().str())
-
-
-@fg.command("base")
-@color_args
-@pass_obj
-def fg_base(codes: ColorContext, color: t.Optional[str]):
-    """Display base foreground color codes"""
-    base_callback(codes, color)
-
-
-@bg.command("base")
-@color_args
-@pass_obj
-def bg_base(codes: ColorContext, color: t.Optional[str]):
-    """Display base background color codes"""
-    base_callback(codes, color)
-
-
-def bright_callback(codes: ColorContext, color: t.Optional[str]):
-    """Display bright color codes"""
-    if color is not None:
-        click.echo(codes.section.bright.to_ansi(color))
-    else:
-        click.echo(codes.section.bright.section().str())
-
-
-@fg.command("bright")
-@color_args
-@pass_obj
-def fg_bright(codes: ColorContext, color: t.Optional[str]):
-    """Display bright foreground color codes"""
-    bright_callback(codes, color)
-
-
-@bg.command("bright")
-@color_args
-@pass_obj
-def bg_bright(codes: ColorContext, color: t.Optional[str]):
-    """Display bright background color codes"""
-    bright_callback(codes, color)
-
-
-def full_callback(codes: ColorContext, index: t.Optional[int]):
-    """Display full background color codes"""
-    if index is not None:
-        click.echo(codes.section.full.to_ansi(index))
-    else:
-        click.echo(codes.section.full.section().str())
-
-
-@fg.command("full")
-@click.argument(
-    "index",
-    type=click.IntRange(0, 255),
-    default=None,
-    required=False,
-)
-@pass_obj
-def fg_full(codes: ColorContext, index: t.Optional[int]):
-    """Display full foreground color codes"""
-    full_callback(codes, index)
-
-
-@bg.command("full")
-@click.argument(
-    "index",
-    type=click.IntRange(0, 255),
-    default=None,
-    required=False,
-)
-@pass_obj
-def bg_full(codes: ColorContext, index: t.Optional[int]):
-    """Display full foreground color codes"""
-    full_callback(codes, index)
-
-
-def rgb_callback(
-    codes: ColorContext,
-    red: t.Optional[int],
-    green: t.Optional[int],
-    blue: t.Optional[int],
-):
-    """Display background color codes"""
-    if red is not None and green is not None and blue is not None:
-        click.echo(codes.section.rgb.to_ansi((red, green, blue)))
-    else:
-        click.echo(codes.section.rgb.section().str())
-
-
-@fg.command("rgb")
-@rgb_args
-@pass_obj
-def fg_rgb(
-    codes: ColorContext,
-    red: t.Optional[int],
-    green: t.Optional[int],
-    blue: t.Optional[int],
-):
-    """Display foreground RGB color codes"""
-    rgb_callback(codes, red, green, blue)
-
-
-@fg.command("rgb")
-@rgb_args
-@pass_obj
-def bg_rgb(
-    codes: ColorContext,
-    red: t.Optional[int],
-    green: t.Optional[int],
-    blue: t.Optional[int],
-):
-    """Display background RGB color codes"""
-    rgb_callback(codes, red, green, blue)
+        echo(codes.codes.text_styles.section().str())
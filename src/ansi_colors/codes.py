@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from typing import List, Dict, TypeVar, Generic, Tuple
 from abc import ABC, abstractmethod
-import os
+import shutil
+from ansi_colors import profiling
 from ansi_colors.support import ColorSupport, supports_color
+from ansi_colors.colorspace import parse_color
 from ansi_colors.utils import warn, debug
+from ansi_colors.width import visible_width, ljust, center
 
 ESCAPE_CODE = "\x1b["
 END_CODE = "m"
@@ -12,16 +15,34 @@ JOIN_CODE = ";"
 
 
 class ShowCode:
+    """An immutable SGR code and the color support level it requires.
+
+    The escape sequence is built once, so ``to_ansi`` is a plain attribute
+    read and instances can be shared freely between threads.
+    """
+
+    __slots__ = ("code", "support", "is_supported", "term", "_ansi")
+
     code: str
     support: ColorSupport
     is_supported: bool
     term: ColorSupport
 
     def __init__(self, code: str, support: ColorSupport):
-        self.code = code
-        self.support = support
-        self.term = supports_color()
-        self.is_supported = self.term.value >= self.support.value
+        term = supports_color()
+        object.__setattr__(self, "code", code)
+        object.__setattr__(self, "support", support)
+        object.__setattr__(self, "term", term)
+        object.__setattr__(self, "is_supported", term.value >= support.value)
+        object.__setattr__(self, "_ansi", f"{ESCAPE_CODE}{code}{END_CODE}")
+        if profiling.ACTIVE is not None:
+            profiling.ACTIVE.count("showcode_allocated")
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("ShowCode is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ShowCode is immutable")
 
     def __str__(self) -> str:
         return f"\\033[{self.code}{END_CODE}"
@@ -34,10 +55,17 @@ class ShowCode:
             warn("Terminal does not support required color level.")
             debug(f"Requested: {self.support}, Detected: {self.term}")
             return ""
-        return f"{ESCAPE_CODE}{self.code}{END_CODE}"
+        if profiling.ACTIVE is not None:
+            profiling.ACTIVE.count("sequences_emitted")
+        return self._ansi
 
 
 RESET_CODE = ShowCode("0", ColorSupport.BASIC)
+# The reset sequence whatever the detected support, for output whose colors
+# are written unconditionally.
+RESET_SEQUENCE = f"{ESCAPE_CODE}{RESET_CODE.code}{END_CODE}"
+# Channel levels of the 6x6x6 cube of the 256-color palette (16-231).
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
 
 
 class Section:
@@ -49,7 +77,8 @@ class Section:
         self.table = table
 
     def str(self) -> str:
-        return f"{TEXT_STYLES.bold.to_ansi()}{self.name}{RESET_CODE.to_ansi()}:\n{self.table}"
+        with profiling.phase("render"):
+            return f"{TEXT_STYLES.bold.to_ansi()}{self.name}{RESET_CODE.to_ansi()}:\n{self.table}"
 
 
 N = TypeVar("N")
@@ -59,7 +88,6 @@ class CodesBase(ABC, Generic[N]):
     title: str
     table_attrs: Dict[str, N]
     is_supported: bool
-    term: ColorSupport = supports_color()
 
     def __init__(
         self,
@@ -71,6 +99,10 @@ class CodesBase(ABC, Generic[N]):
         self.table_attrs = table_attrs
         self.is_supported = supports_color().value >= support.value
 
+    @property
+    def term(self) -> ColorSupport:
+        return supports_color()
+
     @abstractmethod
     def to_ansi(self, name: N):
         pass
@@ -80,19 +112,19 @@ class CodesBase(ABC, Generic[N]):
         pass
 
     def table(self) -> str:
-        max_len: int = max([len(key) for key in self.table_attrs.keys()]) + 2
+        max_len: int = max([visible_width(key) for key in self.table_attrs.keys()]) + 3
         arr: List[str] = []
         for key, value in self.table_attrs.items():
-            padding = " " * (max_len - len(key))
-            arr.append(
-                f"{self.to_ansi(value)}{key}{RESET_CODE.to_ansi()}:{padding}{getattr(self, str(value))}"
-            )
+            label = ljust(f"{self.to_ansi(value)}{key}{RESET_CODE.to_ansi()}:", max_len)
+            arr.append(f"{label}{getattr(self, str(value))}")
         return "\n".join(arr)
 
     def section(self) -> Section:
+        with profiling.phase("tables"):
+            table = self.table()
         return Section(
             name=self.title,
-            table=self.table(),
+            table=table,
         )
 
 
@@ -183,6 +215,7 @@ class FullAnsiColor(CodesBase[int]):
     code2: str
     start: int
     end: int
+    codes: Tuple[ShowCode, ...]
     max_len: int = 0
     support: ColorSupport = ColorSupport.EXTENDED
 
@@ -193,6 +226,10 @@ class FullAnsiColor(CodesBase[int]):
         self.end = end
         self.max_len = len(str(self.end))
         self.is_supported = supports_color().value >= self.support.value
+        self.codes = tuple(
+            ShowCode(JOIN_CODE.join([code1, code2, str(i)]), self.support)
+            for i in range(self.start, self.end + 1)
+        )
         table_attrs = {str(i): i for i in range(self.start, self.end + 1)}
         super().__init__(title, table_attrs, self.support)
 
@@ -205,8 +242,7 @@ class FullAnsiColor(CodesBase[int]):
     def code(self, index: int) -> ShowCode:
         if index < self.start or index > self.end:
             raise ValueError("Index out of range for the specified ANSI color codes.")
-        codes = [self.code1, self.code2, str(index)]
-        return ShowCode(JOIN_CODE.join(codes), self.support)
+        return self.codes[index - self.start]
 
     def to_ansi(self, index: int) -> str:
         if not self.is_supported:
@@ -220,7 +256,7 @@ class FullAnsiColor(CodesBase[int]):
 
     def table(self) -> str:
         colors = []
-        term_width = os.get_terminal_size().columns - 4
+        term_width = shutil.get_terminal_size().columns - 4
         cols = term_width // (self.max_len + 1)
         for i in range(self.start, self.end + 1):
             end = RESET_CODE.to_ansi()
@@ -232,15 +268,10 @@ class FullAnsiColor(CodesBase[int]):
         return " ".join(colors)
 
     def pad(self, text: str) -> str:
-        padding = self.max_len - len(text)
-        front_pad = padding // 2
-        back_pad = padding - front_pad
-        front = " " * front_pad
-        back = " " * back_pad
-        return front + text + back
+        return center(text, self.max_len)
 
 
-class RGBColor(CodesBase[Tuple[int, int, int]]):
+class RGBColor(CodesBase[Tuple[int, int, int] | str]):
     code1: str
     code2: str
     support: ColorSupport = ColorSupport.TRUECOLOR
@@ -260,20 +291,26 @@ class RGBColor(CodesBase[Tuple[int, int, int]]):
     def __repr__(self) -> str:
         return f"\\033[{self.code1};{self.code2};<r>;<g>;<b>{END_CODE}"
 
-    def code(self, color: Tuple[int, int, int]) -> ShowCode:
+    def code(self, color: Tuple[int, int, int] | str) -> ShowCode:
+        return ShowCode(self.params(color), self.support)
+
+    def params(self, color: Tuple[int, int, int] | str) -> str:
+        if isinstance(color, str):
+            color = parse_color(color)
         if not all(0 <= val <= 255 for val in color):
             raise ValueError("RGB values must be in the range 0-255.")
-        codes = [self.code1, self.code2, str(color[0]), str(color[1]), str(color[2])]
-        return ShowCode(JOIN_CODE.join(codes), self.support)
+        return f"{self.code1};{self.code2};{color[0]};{color[1]};{color[2]}"
 
-    def to_ansi(self, color: Tuple[int, int, int]) -> str:
+    def to_ansi(self, color: Tuple[int, int, int] | str) -> str:
         if not self.is_supported:
             warn("Terminal does not support required color level.")
             debug(f"Requested: {self.support}, Detected: {self.term}")
             return ""
-        return self.code(color).to_ansi()
+        if profiling.ACTIVE is not None:
+            profiling.ACTIVE.count("sequences_emitted")
+        return f"{ESCAPE_CODE}{self.params(color)}{END_CODE}"
 
-    def get(self, color: Tuple[int, int, int]) -> str:
+    def get(self, color: Tuple[int, int, int] | str) -> str:
         return str(self.code(color))
 
     def table(self) -> str:
@@ -335,14 +372,15 @@ class ColorTypes:
             )
 
     def show_all(self) -> str:
-        sections: List[Section] = [
-            self.base.section(),
-            self.bright.section(),
-            self.full.section(),
-            self.rgb.section(),
-        ]
-        output = [s.str() for s in sections]
-        return "\n\n".join(output)
+        with profiling.phase("render"):
+            sections: List[Section] = [
+                self.base.section(),
+                self.bright.section(),
+                self.full.section(),
+                self.rgb.section(),
+            ]
+            output = [s.str() for s in sections]
+            return "\n\n".join(output)
 
 
 class AnsiCodes:
@@ -370,6 +408,10 @@ class AnsiCodes:
     )
 
     def show_all(self) -> str:
+        with profiling.phase("render"):
+            return self._show_all()
+
+    def _show_all(self) -> str:
         sections: List[str] = [
             Section(
                 name="Escape Codes",
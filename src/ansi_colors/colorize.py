@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+from collections import deque
+import mmap
+import os
+import re
+import stat
+from ansi_colors import profiling
+from ansi_colors.codes import RESET_CODE
+from ansi_colors.markup import style_sequence
+from ansi_colors.rules import (
+    PASSTHROUGH_GROUP,
+    compile_rules,
+    group_name,
+    parse_rules,
+)
+from ansi_colors.width import ESCAPE_PATTERN
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+RuleState = Tuple[Tuple[Tuple[str, str], ...], int, str]
+
+
+class RuleSet:
+    """Regex -> style rules compiled into a single alternation.
+
+    Every rule becomes a named group of one combined pattern, so a chunk is
+    colorized with a single ``re.sub`` pass; when several rules could match
+    at the same position the earliest rule wins. Styles are resolved to their
+    escape sequences once, when the rule set is built. Because of the extra
+    groups, numbered backreferences inside a pattern are not supported; use
+    named groups instead.
+
+    Patterns run on text decoded as UTF-8, so classes such as ``\\w`` and
+    ``[éï]`` work on characters; undecodable bytes pass through unchanged,
+    and so do escape sequences already in the input.
+    """
+
+    rules: Tuple[Tuple[str, str], ...]
+    flags: int
+    reset: str
+
+    def __init__(
+        self,
+        rules: Sequence[Tuple[str, str]],
+        ignore_case: bool = False,
+    ):
+        if not rules:
+            raise ValueError("At least one rule is required.")
+        self.rules = tuple((pattern, style_sequence(style)) for pattern, style in rules)
+        self.flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+        self.reset = RESET_CODE.to_ansi()
+        self._compile()
+
+    @classmethod
+    def parse(cls, specs: Sequence[str], ignore_case: bool = False) -> RuleSet:
+        """Build a rule set from ``PATTERN=STYLE`` strings."""
+        return cls(parse_rules(specs), ignore_case)
+
+    def _compile(self) -> None:
+        self._groups: Dict[str, str] = {
+            group_name(i): sequence for i, (_, sequence) in enumerate(self.rules)
+        }
+        self._groups[PASSTHROUGH_GROUP] = ""
+        self._regex = compile_rules(
+            [pattern for pattern, _ in self.rules], self.flags, ESCAPE_PATTERN
+        )
+
+    def __getstate__(self) -> RuleState:
+        return (self.rules, self.flags, self.reset)
+
+    def __setstate__(self, state: RuleState) -> None:
+        self.rules, self.flags, self.reset = state
+        self._compile()
+
+    def _replace(self, m: re.Match) -> str:
+        text = m.group()
+        sequence = self._groups[m.lastgroup]  # type: ignore[index]
+        if not text or not sequence:
+            return text
+        return sequence + text + self.reset
+
+    def apply(self, data: bytes) -> bytes:
+        # Chunks end at line boundaries, so no character is ever split.
+        text = data.decode("utf-8", "surrogateescape")
+        text = self._regex.sub(self._replace, text)
+        return text.encode("utf-8", "surrogateescape")
+
+
+def _line_ranges(
+    size: int, view: mmap.mmap, chunk_size: int
+) -> Iterator[Tuple[int, int]]:
+    start = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            newline = view.find(b"\n", end)
+            end = size if newline == -1 else newline + 1
+        yield start, end
+        start = end
+
+
+def _line_chunks(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Yield line-aligned chunks of ``stream`` as soon as data arrives.
+
+    ``read1`` returns what is available instead of waiting for a whole
+    chunk, so a live pipe such as ``tail -f`` is colorized as it is written.
+    An unfinished last line waits for the next read.
+    """
+    read = getattr(stream, "read1", stream.read)
+    partial = b""
+    while True:
+        data = read(chunk_size)
+        if not data:
+            if partial:
+                yield partial
+            return
+        end = data.rfind(b"\n") + 1
+        if end:
+            yield partial + data[:end]
+            partial = data[end:]
+        else:
+            partial += data
+
+
+def _write(output: BinaryIO, data: bytes) -> None:
+    profiling.write(output, data)
+    output.flush()
+
+
+_worker_rules: Optional[RuleSet] = None
+_worker_maps: Dict[str, mmap.mmap] = {}
+
+
+def _init_worker(rules: RuleSet) -> None:
+    global _worker_rules
+    _worker_rules = rules
+
+
+def _worker_view(path: str) -> mmap.mmap:
+    view = _worker_maps.get(path)
+    if view is None:
+        with open(path, "rb") as f:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _worker_maps[path] = view
+    return view
+
+
+def _colorize_range(path: str, start: int, end: int) -> bytes:
+    assert _worker_rules is not None
+    return _worker_rules.apply(_worker_view(path)[start:end])
+
+
+def _colorize_chunk(chunk: bytes) -> bytes:
+    assert _worker_rules is not None
+    return _worker_rules.apply(chunk)
+
+
+def _run_ordered(
+    rules: RuleSet,
+    jobs: int,
+    func: Callable[..., bytes],
+    tasks: Iterable[Tuple[Any, ...]],
+    output: BinaryIO,
+) -> None:
+    # Only the parallel path needs multiprocessing, which is slow to import.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(rules,)
+    ) as pool:
+        in_flight: Deque[Future] = deque()
+        for args in tasks:
+            in_flight.append(pool.submit(func, *args))
+            # Write finished chunks right away, waiting only when too many
+            # are in flight.
+            while in_flight and (len(in_flight) >= 2 * jobs or in_flight[0].done()):
+                _write(output, in_flight.popleft().result())
+        while in_flight:
+            _write(output, in_flight.popleft().result())
+
+
+def colorize_stream(
+    rules: RuleSet,
+    source: BinaryIO,
+    output: BinaryIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Colorize ``source`` into ``output`` in line-aligned chunks, in process.
+
+    Output is flushed after every chunk.
+    """
+    for chunk in _line_chunks(source, chunk_size):
+        _write(output, rules.apply(chunk))
+
+
+def colorize_file(
+    rules: RuleSet,
+    path: str,
+    output: BinaryIO,
+    jobs: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Colorize the file at ``path`` into ``output``.
+
+    With ``jobs > 1`` the file is memory-mapped and split at line boundaries.
+    Chunks are colorized in a process pool whose workers receive the rule set
+    once, at start-up, and map the file themselves so only offsets cross the
+    process boundary. Results are written in input order, and at most
+    ``2 * jobs`` chunks are in flight at any time.
+
+    Anything but a regular file, such as the pipe behind ``<(zcat log.gz)``,
+    is read like a stream with :func:`colorize_pipe`.
+    """
+    with open(path, "rb") as f:
+        info = os.fstat(f.fileno())
+        if not stat.S_ISREG(info.st_mode):
+            colorize_pipe(rules, f, output, jobs, chunk_size)
+            return
+        size = info.st_size
+        if size == 0:
+            return
+        if jobs <= 1:
+            colorize_stream(rules, f, output, chunk_size)
+            return
+        view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        ranges = (
+            (path, start, end) for start, end in _line_ranges(size, view, chunk_size)
+        )
+        _run_ordered(rules, jobs, _colorize_range, ranges, output)
+    finally:
+        view.close()
+
+
+def colorize_pipe(
+    rules: RuleSet,
+    source: BinaryIO,
+    output: BinaryIO,
+    jobs: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Like :func:`colorize_file`, for streams that cannot be memory-mapped."""
+    if jobs <= 1:
+        colorize_stream(rules, source, output, chunk_size)
+        return
+    chunks = ((chunk,) for chunk in _line_chunks(source, chunk_size))
+    _run_ordered(rules, jobs, _colorize_chunk, chunks, output)
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+from typing import Tuple
+from functools import lru_cache
+import colorsys
+import re
+
+RGB = Tuple[int, int, int]
+Triple = Tuple[float, float, float]
+
+CACHE_SIZE = 4096
+
+HEX_RE = re.compile(r"#?([0-9a-fA-F]{6}|[0-9a-fA-F]{3})")
+FUNC_RE = re.compile(r"(rgb|hsl|hsv)[:(]\s*([^)]*?)\s*\)?", re.IGNORECASE)
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "Batch color conversions require numpy; install ansi-colors[numpy]."
+        ) from e
+    return np
+
+
+def _batch_array(values):
+    np = _numpy()
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.shape[-1] != 3:
+        raise ValueError("Batch conversions expect an array of shape (..., 3).")
+    return np, arr
+
+
+def _check_rgb(color: RGB) -> None:
+    if len(color) != 3 or not all(0 <= val <= 255 for val in color):
+        raise ValueError("RGB values must be in the range 0-255.")
+
+
+def _to_byte(value: float) -> int:
+    return max(0, min(255, round(value * 255)))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def hex_to_rgb(value: str) -> RGB:
+    """Convert ``#rrggbb`` or ``#rgb`` (leading ``#`` optional) to RGB."""
+    m = HEX_RE.fullmatch(value.strip())
+    if m is None:
+        raise ValueError(f"Invalid hex color '{value}'.")
+    digits = m.group(1)
+    if len(digits) == 3:
+        digits = "".join(c * 2 for c in digits)
+    return (int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def rgb_to_hex(color: RGB) -> str:
+    _check_rgb(color)
+    return f"#{color[0]:02x}{color[1]:02x}{color[2]:02x}"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def rgb_to_hsl(color: RGB) -> Triple:
+    """Convert RGB to ``(hue 0-360, saturation 0-100, lightness 0-100)``."""
+    _check_rgb(color)
+    h, lightness, s = colorsys.rgb_to_hls(*(c / 255 for c in color))
+    return (h * 360, s * 100, lightness * 100)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def hsl_to_rgb(color: Triple) -> RGB:
+    """Convert ``(hue 0-360, saturation 0-100, lightness 0-100)`` to RGB."""
+    h, s, lightness = color
+    if not (0 <= s <= 100 and 0 <= lightness <= 100):
+        raise ValueError("Saturation and lightness must be in the range 0-100.")
+    r, g, b = colorsys.hls_to_rgb((h % 360) / 360, lightness / 100, s / 100)
+    return (_to_byte(r), _to_byte(g), _to_byte(b))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def rgb_to_hsv(color: RGB) -> Triple:
+    """Convert RGB to ``(hue 0-360, saturation 0-100, value 0-100)``."""
+    _check_rgb(color)
+    h, s, v = colorsys.rgb_to_hsv(*(c / 255 for c in color))
+    return (h * 360, s * 100, v * 100)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def hsv_to_rgb(color: Triple) -> RGB:
+    """Convert ``(hue 0-360, saturation 0-100, value 0-100)`` to RGB."""
+    h, s, v = color
+    if not (0 <= s <= 100 and 0 <= v <= 100):
+        raise ValueError("Saturation and value must be in the range 0-100.")
+    r, g, b = colorsys.hsv_to_rgb((h % 360) / 360, s / 100, v / 100)
+    return (_to_byte(r), _to_byte(g), _to_byte(b))
+
+
+_OKLAB_M1 = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+_OKLAB_M2 = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+_OKLAB_M2_INV = (
+    (1.0, 0.3963377774, 0.2158037573),
+    (1.0, -0.1055613458, -0.0638541728),
+    (1.0, -0.0894841775, -1.2914855480),
+)
+_OKLAB_M1_INV = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.7076147010),
+)
+
+
+def _dot(row: Triple, vec) -> float:
+    return row[0] * vec[0] + row[1] * vec[1] + row[2] * vec[2]
+
+
+def _srgb_to_linear(c: float) -> float:
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(c: float) -> float:
+    return 12.92 * c if c <= 0.0031308 else 1.055 * c ** (1 / 2.4) - 0.055
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def rgb_to_oklab(color: RGB) -> Triple:
+    """Convert RGB to OKLab ``(L, a, b)``."""
+    _check_rgb(color)
+    linear = tuple(_srgb_to_linear(c / 255) for c in color)
+    lms = tuple(_dot(row, linear) ** (1 / 3) for row in _OKLAB_M1)
+    return tuple(_dot(row, lms) for row in _OKLAB_M2)  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def oklab_to_rgb(color: Triple) -> RGB:
+    """Convert OKLab ``(L, a, b)`` to RGB, clipping out-of-gamut values."""
+    lms = tuple(_dot(row, color) ** 3 for row in _OKLAB_M2_INV)
+    linear = (_dot(row, lms) for row in _OKLAB_M1_INV)
+    r, g, b = (_linear_to_srgb(max(0.0, min(1.0, c))) for c in linear)
+    return (_to_byte(r), _to_byte(g), _to_byte(b))
+
+
+def _split_components(body: str) -> Triple:
+    parts = [p.strip().rstrip("%").rstrip("°") for p in re.split(r"[,\s]+", body)]
+    parts = [p for p in parts if p]
+    if len(parts) != 3:
+        raise ValueError(f"Expected three components, got '{body}'.")
+    try:
+        return (float(parts[0]), float(parts[1]), float(parts[2]))
+    except ValueError as e:
+        raise ValueError(f"Invalid color components '{body}'.") from e
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_color(value: str) -> RGB:
+    """Parse a color string into an RGB tuple.
+
+    Accepts ``#rrggbb``, ``#rgb``, ``rgb:r,g,b``, ``hsl:h,s,l``,
+    ``hsv:h,s,v`` and the CSS-like ``rgb(...)``/``hsl(...)``/``hsv(...)``.
+    """
+    text = value.strip()
+    if text.startswith("#"):
+        return hex_to_rgb(text)
+    m = FUNC_RE.fullmatch(text)
+    if m is None:
+        raise ValueError(
+            f"Invalid color '{value}'. Use '#rrggbb', 'rgb:r,g,b' or 'hsl:h,s,l'."
+        )
+    space = m.group(1).lower()
+    components = _split_components(m.group(2))
+    if space == "hsl":
+        return hsl_to_rgb(components)
+    if space == "hsv":
+        return hsv_to_rgb(components)
+    if not all(c.is_integer() for c in components):
+        raise ValueError("RGB values must be integers.")
+    color = (int(components[0]), int(components[1]), int(components[2]))
+    _check_rgb(color)
+    return color
+
+
+def rgb_to_hex_batch(colors) -> list:
+    """Convert an array of shape ``(..., 3)`` to a flat list of hex strings."""
+    np, arr = _batch_array(colors)
+    ints = np.clip(np.rint(arr), 0, 255).astype(np.uint32)
+    packed = (ints[..., 0] << 16) | (ints[..., 1] << 8) | ints[..., 2]
+    return [f"#{v:06x}" for v in packed.ravel().tolist()]
+
+
+def hex_to_rgb_batch(values):
+    """Convert a sequence of hex strings to a ``uint8`` array of shape ``(n, 3)``."""
+    np = _numpy()
+    return np.array([hex_to_rgb(v) for v in values], dtype=np.uint8)
+
+
+def rgb_to_hsl_batch(colors):
+    """Vectorised :func:`rgb_to_hsl` over an array of shape ``(..., 3)``."""
+    np, arr = _batch_array(colors)
+    rgb = arr / 255
+    cmax = rgb.max(axis=-1)
+    cmin = rgb.min(axis=-1)
+    delta = cmax - cmin
+    lightness = (cmax + cmin) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(delta == 0, 0.0, delta / (1 - np.abs(2 * lightness - 1)))
+    h = _hue(np, rgb, cmax, delta)
+    # Rounding can land just outside 0-100, which hsl_to_rgb rejects.
+    s = np.clip(s * 100, 0, 100)
+    lightness = np.clip(lightness * 100, 0, 100)
+    return np.stack([h, s, lightness], axis=-1)
+
+
+def hsl_to_rgb_batch(colors):
+    """Vectorised :func:`hsl_to_rgb` over an array of shape ``(..., 3)``."""
+    np, arr = _batch_array(colors)
+    h = (arr[..., 0] % 360) / 60
+    s = arr[..., 1] / 100
+    lightness = arr[..., 2] / 100
+    c = (1 - np.abs(2 * lightness - 1)) * s
+    return _from_chroma(np, h, c, lightness - c / 2)
+
+
+def rgb_to_hsv_batch(colors):
+    """Vectorised :func:`rgb_to_hsv` over an array of shape ``(..., 3)``."""
+    np, arr = _batch_array(colors)
+    rgb = arr / 255
+    cmax = rgb.max(axis=-1)
+    delta = cmax - rgb.min(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(cmax == 0, 0.0, delta / cmax)
+    h = _hue(np, rgb, cmax, delta)
+    return np.stack([h, s * 100, cmax * 100], axis=-1)
+
+
+def hsv_to_rgb_batch(colors):
+    """Vectorised :func:`hsv_to_rgb` over an array of shape ``(..., 3)``."""
+    np, arr = _batch_array(colors)
+    h = (arr[..., 0] % 360) / 60
+    c = (arr[..., 2] / 100) * (arr[..., 1] / 100)
+    return _from_chroma(np, h, c, arr[..., 2] / 100 - c)
+
+
+def _hue(np, rgb, cmax, delta):
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h = np.select(
+            [delta == 0, cmax == r, cmax == g],
+            [0.0, ((g - b) / delta) % 6, (b - r) / delta + 2],
+            (r - g) / delta + 4,
+        )
+    return h * 60
+
+
+def _from_chroma(np, h, c, m):
+    x = c * (1 - np.abs(h % 2 - 1))
+    zero = np.zeros_like(c)
+    sector = np.floor(h).astype(np.intp) % 6
+    r = np.choose(sector, [c, x, zero, zero, x, c])
+    g = np.choose(sector, [x, c, c, x, zero, zero])
+    b = np.choose(sector, [zero, zero, x, c, c, x])
+    rgb = np.stack([r + m, g + m, b + m], axis=-1)
+    return np.clip(np.rint(rgb * 255), 0, 255).astype(np.uint8)
+
+
+def rgb_to_oklab_batch(colors):
+    """Vectorised :func:`rgb_to_oklab` over an array of shape ``(..., 3)``."""
+    np, arr = _batch_array(colors)
+    c = arr / 255
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    lms = np.cbrt(linear @ np.array(_OKLAB_M1).T)
+    return lms @ np.array(_OKLAB_M2).T
+
+
+def oklab_to_rgb_batch(colors):
+    """Vectorised :func:`oklab_to_rgb` over an array of shape ``(..., 3)``."""
+    np, arr = _batch_array(colors)
+    lms = (arr @ np.array(_OKLAB_M2_INV).T) ** 3
+    linear = np.clip(lms @ np.array(_OKLAB_M1_INV).T, 0.0, 1.0)
+    srgb = np.where(
+        linear <= 0.0031308, 12.92 * linear, 1.055 * linear ** (1 / 2.4) - 0.055
+    )
+    return np.clip(np.rint(srgb * 255), 0, 255).astype(np.uint8)
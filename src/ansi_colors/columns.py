@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import csv
+import re
+from collections import deque
+from itertools import chain
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+from ansi_colors import profiling
+from ansi_colors.codes import ESCAPE_CODE, END_CODE, RESET_SEQUENCE
+from ansi_colors.markup import style_params
+from ansi_colors.rules import compile_rules, group_name, parse_rules
+from ansi_colors.width import visible_width
+
+DEFAULT_WINDOW = 100
+SEPARATOR = "  "
+# Bound on the cell value -> rule style cache.
+MAX_CACHED_VALUES = 4096
+
+FORMATS = ("auto", "csv", "tsv", "whitespace")
+PALETTES: Dict[str, Tuple[str, ...]] = {
+    "base": ("cyan", "green", "yellow", "blue", "magenta", "red"),
+    "bright": (
+        "bright_cyan",
+        "bright_green",
+        "bright_yellow",
+        "bright_blue",
+        "bright_magenta",
+        "bright_red",
+    ),
+    "full": (
+        "full:39",
+        "full:114",
+        "full:221",
+        "full:75",
+        "full:176",
+        "full:209",
+        "full:80",
+        "full:147",
+    ),
+}
+
+# A resolved cell style: the escape sequence that resets and applies it in
+# one code ("" for no style), and whether it shows on spaces.
+CellStyle = Tuple[str, bool]
+
+
+def _marks_spaces(params: str) -> bool:
+    """Whether SGR ``params`` change how a space looks, e.g. a background."""
+    values = params.split(";")
+    i = 0
+    while i < len(values):
+        value = int(values[i] or 0)
+        if value == 38:
+            # Skip the arguments of 38;5;N and 38;2;R;G;B.
+            i += 3 if values[i + 1 : i + 2] == ["5"] else 5
+            continue
+        if value in (4, 7, 9, 21, 48, 53) or 40 <= value <= 47 or 100 <= value <= 107:
+            return True
+        i += 1
+    return False
+
+
+def cell_style(spec: str) -> CellStyle:
+    params = style_params(spec)
+    if not params:
+        return ("", False)
+    return (f"{ESCAPE_CODE}0;{params}{END_CODE}", _marks_spaces(params))
+
+
+class ColumnStyler:
+    """Styles cells by column, or by value when a rule matches.
+
+    Column ``i`` uses ``styles[i % len(styles)]``. Every style is resolved
+    once into a single escape sequence that also resets the previous one, so
+    a row costs one code per style change plus a final reset. Padding after
+    a style that would show on spaces (backgrounds, underline, ...) is
+    written unstyled.
+
+    Rules are ``(pattern, style)`` pairs searched in each cell; the first
+    rule that matches overrides the column style. Matches are cached per
+    cell value, as columns such as statuses repeat a handful of values.
+    """
+
+    styles: Tuple[CellStyle, ...]
+    header_styles: Tuple[CellStyle, ...]
+
+    def __init__(
+        self,
+        styles: Sequence[str],
+        rules: Sequence[Tuple[str, str]] = (),
+        ignore_case: bool = False,
+    ):
+        if not styles:
+            raise ValueError("At least one column style is required.")
+        self.styles = tuple(cell_style(spec) for spec in styles)
+        self.header_styles = tuple(cell_style(f"bold {spec}") for spec in styles)
+        self._rule_styles: Dict[str, CellStyle] = {
+            group_name(i): cell_style(style) for i, (_, style) in enumerate(rules)
+        }
+        self._regex: Optional[re.Pattern] = None
+        if rules:
+            self._regex = compile_rules(
+                [pattern for pattern, _ in rules],
+                re.IGNORECASE if ignore_case else 0,
+            )
+        self._matches: Dict[str, Optional[CellStyle]] = {}
+
+    @classmethod
+    def parse(
+        cls,
+        styles: Sequence[str],
+        rules: Sequence[str] = (),
+        ignore_case: bool = False,
+    ) -> ColumnStyler:
+        """Build a styler from style specs and ``PATTERN=STYLE`` strings."""
+        return cls(styles, parse_rules(rules), ignore_case)
+
+    def _rule_style(self, value: str) -> Optional[CellStyle]:
+        if value in self._matches:
+            return self._matches[value]
+        assert self._regex is not None
+        m = self._regex.search(value)
+        style = self._rule_styles[m.lastgroup] if m else None  # type: ignore[index]
+        if len(self._matches) >= MAX_CACHED_VALUES:
+            self._matches.clear()
+        self._matches[value] = style
+        return style
+
+    def row(
+        self,
+        cells: Sequence[str],
+        widths: Sequence[int],
+        header: bool = False,
+        cell_widths: Optional[Sequence[int]] = None,
+    ) -> str:
+        """Render one row, padding every cell but the last to ``widths``.
+
+        ``cell_widths`` are the cells' visible widths, when already known.
+        """
+        if cell_widths is None:
+            cell_widths = [visible_width(cell) for cell in cells]
+        styles = self.header_styles if header else self.styles
+        rules = not header and self._regex is not None
+        matches = self._matches
+        rule_style = self._rule_style
+        count = len(styles)
+        last = len(cells) - 1
+        padded = min(last, len(widths))
+        parts: List[str] = []
+        current = ""
+        for i, cell in enumerate(cells):
+            # Empty cells keep whatever style is current: nothing would show.
+            if cell:
+                style = None
+                if rules:
+                    style = matches[cell] if cell in matches else rule_style(cell)
+                if style is None:
+                    style = styles[i % count]
+                sequence, marks_spaces = style
+                if sequence != current:
+                    parts.append(sequence or RESET_SEQUENCE)
+                    current = sequence
+                parts.append(cell)
+                if marks_spaces and i != last:
+                    parts.append(RESET_SEQUENCE)
+                    current = ""
+            if i < padded:
+                padding = widths[i] - cell_widths[i]
+                parts.append(" " * padding + SEPARATOR if padding > 0 else SEPARATOR)
+            elif i != last:
+                parts.append(SEPARATOR)
+        if current:
+            parts.append(RESET_SEQUENCE)
+        return "".join(parts)
+
+
+def cell_width(cell: str) -> int:
+    if cell.isascii() and cell.isprintable():
+        return len(cell)
+    return visible_width(cell)
+
+
+def detect_format(line: str) -> str:
+    if "\t" in line:
+        return "tsv"
+    if "," in line:
+        return "csv"
+    return "whitespace"
+
+
+def read_rows(source: Iterable[str], fmt: str = "auto") -> Iterator[List[str]]:
+    """Split lines into cells; ``auto`` picks the format from the first line."""
+    lines = iter(source)
+    if fmt == "auto":
+        first = next(lines, None)
+        if first is None:
+            return
+        fmt = detect_format(first)
+        lines = chain([first], lines)
+    if fmt == "csv":
+        yield from csv.reader(lines)
+    elif fmt == "tsv":
+        for line in lines:
+            yield line.rstrip("\r\n").split("\t")
+    elif fmt == "whitespace":
+        for line in lines:
+            yield line.split()
+    else:
+        raise ValueError(f"Unknown format '{fmt}'. Expected one of {FORMATS}.")
+
+
+def align(
+    rows: Iterable[List[str]], window: int = DEFAULT_WINDOW
+) -> Iterator[Tuple[List[str], List[int], List[int]]]:
+    """Yield every row with its cells' widths and the widths to pad it to.
+
+    A row is held back until ``window`` more rows have been read, and widths
+    are the widest cells seen so far, so each row is aligned with the rows
+    around it while memory stays bounded by the window. Widths only grow.
+    The yielded column width list is updated in place as more rows are read.
+    """
+    widths: List[int] = []
+    pending: Deque[Tuple[List[str], List[int]]] = deque()
+    for row in rows:
+        text = "".join(row)
+        if text.isascii() and text.isprintable():
+            cell_widths = list(map(len, row))
+        else:
+            cell_widths = [cell_width(cell) for cell in row]
+        if len(cell_widths) > len(widths):
+            widths.extend([0] * (len(cell_widths) - len(widths)))
+        for i, width in enumerate(cell_widths):
+            if width > widths[i]:
+                widths[i] = width
+        pending.append((row, cell_widths))
+        if len(pending) > window:
+            cells, cell_widths = pending.popleft()
+            yield cells, cell_widths, widths
+    while pending:
+        cells, cell_widths = pending.popleft()
+        yield cells, cell_widths, widths
+
+
+def colorize_columns(
+    source: Iterable[str],
+    output: TextIO,
+    styler: ColumnStyler,
+    fmt: str = "auto",
+    window: int = DEFAULT_WINDOW,
+    header: bool = False,
+) -> None:
+    """Stream ``source`` into ``output`` as aligned, styled columns."""
+    row = styler.row
+    write = profiling.write
+    for cells, cell_widths, widths in align(read_rows(source, fmt), window):
+        write(output, row(cells, widths, header, cell_widths) + "\n")
+        header = False
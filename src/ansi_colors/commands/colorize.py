@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import typing as t
+from ansi_colors.colorize import RuleSet, colorize_file, colorize_pipe
+from ansi_colors.context import click
+from ansi_colors.utils import debug
+
+
+@click.command("colorize")
+@click.argument(
+    "input",
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
+    default="-",
+    required=False,
+)
+@click.option(
+    "-r",
+    "--rule",
+    "rules",
+    multiple=True,
+    required=True,
+    metavar="PATTERN=STYLE",
+    help="Color matches of PATTERN with STYLE, e.g. 'ERROR=bold red'. Repeatable.",
+)
+@click.option(
+    "-i",
+    "--ignore-case",
+    is_flag=True,
+    help="Match patterns case-insensitively",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes (0 uses every CPU)",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("wb"),
+    default="-",
+    help="Write to this file instead of standard output",
+)
+def colorize(
+    input: str,
+    rules: t.Tuple[str, ...],
+    ignore_case: bool,
+    jobs: int,
+    output: t.BinaryIO,
+):
+    """Colorize a file using regex to style rules"""
+    debug(f"ansi-colors colorize {input} jobs={jobs}")
+    try:
+        rule_set = RuleSet.parse(rules, ignore_case)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--rule")
+    jobs = jobs or os.cpu_count() or 1
+    if input == "-":
+        colorize_pipe(rule_set, click.get_binary_stream("stdin"), output, jobs)
+    else:
+        colorize_file(rule_set, input, output, jobs)
+    output.flush()
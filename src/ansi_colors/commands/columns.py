@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import typing as t
+from ansi_colors.columns import (
+    DEFAULT_WINDOW,
+    FORMATS,
+    PALETTES,
+    ColumnStyler,
+    colorize_columns,
+)
+from ansi_colors.context import click
+from ansi_colors.utils import debug
+
+
+@click.command("columns")
+@click.argument(
+    "input",
+    type=click.File("r"),
+    default="-",
+    required=False,
+)
+@click.option(
+    "-f",
+    "--format",
+    "fmt",
+    type=click.Choice(FORMATS, case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="Input format; auto picks one from the first line",
+)
+@click.option(
+    "-p",
+    "--palette",
+    type=click.Choice(sorted(PALETTES), case_sensitive=False),
+    default="base",
+    show_default=True,
+    help="Colors to cycle through, one per column",
+)
+@click.option(
+    "-s",
+    "--style",
+    "styles",
+    multiple=True,
+    metavar="STYLE",
+    help="Column style to cycle through instead of the palette. Repeatable.",
+)
+@click.option(
+    "-r",
+    "--rule",
+    "rules",
+    multiple=True,
+    metavar="PATTERN=STYLE",
+    help="Style cells matching PATTERN with STYLE, e.g. 'Error=bold red'. Repeatable.",
+)
+@click.option(
+    "-i",
+    "--ignore-case",
+    is_flag=True,
+    help="Match rule patterns case-insensitively",
+)
+@click.option(
+    "-H",
+    "--header",
+    is_flag=True,
+    help="Render the first row in bold",
+)
+@click.option(
+    "-w",
+    "--window",
+    type=click.IntRange(0),
+    default=DEFAULT_WINDOW,
+    show_default=True,
+    help="Rows to read ahead when computing column widths",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w", encoding="utf-8"),
+    default="-",
+    help="Write to this file instead of standard output",
+)
+def columns(
+    input: t.TextIO,
+    fmt: str,
+    palette: str,
+    styles: t.Tuple[str, ...],
+    rules: t.Tuple[str, ...],
+    ignore_case: bool,
+    header: bool,
+    window: int,
+    output: t.TextIO,
+):
+    """Align and color the columns of CSV, TSV or whitespace tables"""
+    debug(f"ansi-colors columns {fmt} window={window}")
+    try:
+        styler = ColumnStyler.parse(
+            styles or PALETTES[palette.lower()], rules, ignore_case
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--style/--rule")
+    colorize_columns(input, output, styler, fmt.lower(), window, header)
+    output.flush()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import typing as t
+from ansi_colors.context import click
+from ansi_colors.export import export
+from ansi_colors.utils import debug
+
+
+@click.command("export-html")
+@click.argument(
+    "input",
+    type=click.File("rb"),
+    default="-",
+    required=False,
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w", encoding="utf-8"),
+    default="-",
+    help="Write to this file instead of standard output",
+)
+@click.option(
+    "-f",
+    "--format",
+    "fmt",
+    type=click.Choice(["html", "svg"], case_sensitive=False),
+    default="html",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "-t",
+    "--title",
+    default="ansi-colors",
+    show_default=True,
+    help="Document title",
+)
+def export_html(input: t.BinaryIO, output: t.TextIO, fmt: str, title: str):
+    """Convert ANSI colored text to HTML or SVG"""
+    debug(f"ansi-colors export-html {fmt}")
+    export(input, output, fmt.lower(), title)
+    output.flush()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import shutil
+import typing as t
+from ansi_colors import profiling
+from ansi_colors.context import click
+from ansi_colors.image import Netpbm, render_image
+from ansi_colors.support import ColorSupport, supports_color
+from ansi_colors.utils import debug, warn
+
+
+@click.command("image")
+@click.argument(
+    "input",
+    type=click.File("rb"),
+    default="-",
+    required=False,
+)
+@click.option(
+    "-w",
+    "--width",
+    type=click.IntRange(1),
+    help="Width in cells (defaults to the terminal width)",
+)
+@click.option(
+    "-c",
+    "--colors",
+    type=click.Choice(["auto", "truecolor", "256"], case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="Color encoding; auto picks truecolor when the terminal supports it",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w", encoding="utf-8"),
+    default="-",
+    help="Write to this file instead of standard output",
+)
+def image(input: t.BinaryIO, width: t.Optional[int], colors: str, output: t.TextIO):
+    """Render a binary PPM/PGM image with half blocks"""
+    debug(f"ansi-colors image {colors}")
+    try:
+        picture = Netpbm(input)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="INPUT")
+    if width is None:
+        width = min(picture.width, shutil.get_terminal_size().columns)
+    support = supports_color()
+    if colors == "auto":
+        truecolor = support == ColorSupport.TRUECOLOR
+    else:
+        truecolor = colors == "truecolor"
+    if support.value < ColorSupport.EXTENDED.value:
+        warn("Terminal does not support required color level.")
+    try:
+        for line in render_image(picture, width, truecolor):
+            profiling.write(output, line + "\n")
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    output.flush()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import typing as t
+from ansi_colors.cli import echo
+from ansi_colors.context import click
+from ansi_colors.theme import load_theme
+from ansi_colors.utils import debug
+
+
+@click.command("theme")
+@click.argument(
+    "path",
+    type=click.Path(exists=True, dir_okay=False),
+    required=False,
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Compile the theme without reading or writing the cache",
+)
+def theme(path: t.Optional[str], no_cache: bool):
+    """Preview the styles of a theme file"""
+    debug(f"ansi-colors theme {path}")
+    try:
+        loaded = load_theme(path, use_cache=not no_cache)
+    except FileNotFoundError as e:
+        raise click.FileError(e.filename, hint="No theme file found")
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    width = max((len(name) for name in loaded), default=0)
+    for name in loaded:
+        echo(f"{loaded.style(name, name.ljust(width))}  {loaded.specs[name]}")
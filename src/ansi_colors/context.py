@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
+import sys
 import typing as t
-import rich_click as click
 from ansi_colors.codes import AnsiCodes, ColorTypes
-from threading import local
+from ansi_colors.colorspace import parse_color
 from functools import update_wrapper
 
 if t.TYPE_CHECKING:
@@ -11,27 +12,54 @@ if t.TYPE_CHECKING:
 
     P = te.ParamSpec("P")
 
+# Setting this to any non-empty value keeps `--help` on plain click output.
+PLAIN_HELP_ENV = "ANSI_COLORS_PLAIN_HELP"
+
+
+def rich_help_requested(argv: t.Sequence[str]) -> bool:
+    """Whether ``argv`` asks for help that should be rendered with rich_click."""
+    return "--help" in argv and not os.environ.get(PLAIN_HELP_ENV)
+
+
+# rich_click (and rich) take longer to import than the rest of a lookup, and
+# only change how help is rendered. Commands are built with plain click
+# unless help was asked for; `BaseGroup` is the matching group class.
+if rich_help_requested(sys.argv[1:]):
+    import rich_click as click
+
+    BaseGroup: t.Type[click.Group] = click.RichGroup
+else:
+    import click
+
+    BaseGroup = click.Group
+
 R = t.TypeVar("R")
 T = t.TypeVar("T")
 _AnyCallable = t.Callable[..., t.Any]
 
-_local = local()
-
 
 class ColorContext:
+    """The code tables seen by a command, optionally narrowed to a section.
+
+    Contexts are never mutated: selecting a section returns a new context, so
+    nothing is shared between concurrent invocations except the immutable
+    code tables themselves.
+    """
+
     codes: AnsiCodes
 
-    def __init__(self):
+    def __init__(self, section: str = ""):
         self.codes = AnsiCodes()
-        self._section = ""
+        self._section = section
 
     @property
     def section(self) -> ColorTypes:
+        if not self._section:
+            raise AttributeError("No color section has been selected.")
         return getattr(self.codes, self._section)
 
-    @section.setter
-    def section(self, value: str):
-        self._section = value
+    def with_section(self, section: str) -> ColorContext:
+        return ColorContext(section)
 
 
 def pass_context(
@@ -87,10 +115,49 @@ def color_args(f):
     return update_wrapper(new_func, f)
 
 
+def index_args(f):
+    @click.argument(
+        "index",
+        type=click.IntRange(0, 255),
+        default=None,
+        required=False,
+    )
+    def new_func(
+        index: t.Optional[int] = None,
+        *args,
+        **kwargs,
+    ):
+        return f(index=index, *args, **kwargs)
+
+    return update_wrapper(new_func, f)
+
+
+class ColorParamType(click.ParamType):
+    """A red channel value, or a whole color as ``#rrggbb`` or ``hsl:h,s,l``."""
+
+    name = "red|color"
+
+    def convert(
+        self,
+        value: t.Any,
+        param: t.Optional[click.Parameter],
+        ctx: t.Optional[click.Context],
+    ) -> t.Union[int, t.Tuple[int, int, int]]:
+        if isinstance(value, (int, tuple)):
+            return value
+        text = str(value).strip()
+        if text.isdigit():
+            return click.IntRange(0, 255).convert(text, param, ctx)
+        try:
+            return parse_color(text)
+        except ValueError as e:
+            self.fail(str(e), param, ctx)
+
+
 def rgb_args(f):
     @click.argument(
         "red",
-        type=click.IntRange(0, 255),
+        type=ColorParamType(),
         default=None,
         required=False,
     )
@@ -107,7 +174,7 @@ def rgb_args(f):
         required=False,
     )
     def new_func(
-        red: t.Optional[int] = None,
+        red: t.Optional[t.Union[int, t.Tuple[int, int, int]]] = None,
         green: t.Optional[int] = None,
         blue: t.Optional[int] = None,
         *args,
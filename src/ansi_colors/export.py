@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple
+import codecs
+import html
+import io
+import re
+from ansi_colors import profiling
+from ansi_colors.codes import CUBE_LEVELS
+from ansi_colors.colorspace import rgb_to_hex
+
+READ_SIZE = 64 * 1024
+# Longest incomplete escape sequence carried over between reads; anything
+# longer is treated as text.
+MAX_CARRY = 256
+MAX_TRANSITIONS = 4096
+# Bound on the style -> tag/CSS caches of the writers.
+MAX_CACHED_STYLES = 4096
+
+# Any escape sequence. Group 1/2 are the parameters and final byte of a CSI
+# sequence; only SGR (final byte "m") affects the output, the rest is dropped.
+# nF escapes such as the charset selection `ESC ( B` are dropped too. An OSC
+# left unterminated by the next sequence ends there, and a stray ESC that
+# starts no sequence is dropped on its own.
+SEQ_RE = re.compile(
+    r"\x1b(?:\[([0-?]*)[ -/]*([@-~])"
+    r"|\][^\x07\x1b]*(?:\x07|\x1b\\)?"
+    r"|[ -/]+[0-~]"
+    r"|[@-Z\\^_])?"
+)
+# An unfinished sequence at the end of a chunk, carried over to the next one.
+PARTIAL_RE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?|[ -/]+)?\Z")
+
+# xterm's default 16-color palette: 30-37/40-47 then 90-97/100-107.
+BASE_PALETTE: Tuple[str, ...] = (
+    "#000000",
+    "#cd0000",
+    "#00cd00",
+    "#cdcd00",
+    "#0000ee",
+    "#cd00cd",
+    "#00cdcd",
+    "#e5e5e5",
+    "#7f7f7f",
+    "#ff0000",
+    "#00ff00",
+    "#ffff00",
+    "#5c5cff",
+    "#ff00ff",
+    "#00ffff",
+    "#ffffff",
+)
+
+DEFAULT_FOREGROUND = "#d4d4d4"
+DEFAULT_BACKGROUND = "#1e1e1e"
+
+
+def _palette_256() -> Tuple[str, ...]:
+    colors = list(BASE_PALETTE)
+    for i in range(216):
+        colors.append(
+            rgb_to_hex(
+                (CUBE_LEVELS[i // 36], CUBE_LEVELS[(i // 6) % 6], CUBE_LEVELS[i % 6])
+            )
+        )
+    for i in range(24):
+        level = 8 + 10 * i
+        colors.append(rgb_to_hex((level, level, level)))
+    return tuple(colors)
+
+
+PALETTE_256 = _palette_256()
+
+# Style state: foreground, background, then the attribute flags below.
+FG, BG, BOLD, DIM, ITALIC, UNDERLINE, BLINK, REVERSE, HIDDEN, STRIKE = range(10)
+Style = Tuple[
+    Optional[str], Optional[str], bool, bool, bool, bool, bool, bool, bool, bool
+]
+PLAIN: Style = (None, None, False, False, False, False, False, False, False, False)
+
+# SGR attribute codes: code -> (slot, value).
+ATTRIBUTES: Dict[int, Tuple[int, bool]] = {
+    1: (BOLD, True),
+    2: (DIM, True),
+    3: (ITALIC, True),
+    4: (UNDERLINE, True),
+    5: (BLINK, True),
+    7: (REVERSE, True),
+    8: (HIDDEN, True),
+    9: (STRIKE, True),
+    21: (BOLD, False),
+    23: (ITALIC, False),
+    24: (UNDERLINE, False),
+    25: (BLINK, False),
+    27: (REVERSE, False),
+    28: (HIDDEN, False),
+    29: (STRIKE, False),
+}
+
+
+def _extended_color(params: List[int], i: int) -> Tuple[Optional[str], int]:
+    """Decode ``5;n`` or ``2;r;g;b`` after a 38/48; return (color, next index)."""
+    if i < len(params) and params[i] == 5 and i + 1 < len(params):
+        index = params[i + 1]
+        return (PALETTE_256[index] if 0 <= index <= 255 else None), i + 2
+    if i < len(params) and params[i] == 2 and i + 3 < len(params):
+        r, g, b = params[i + 1 : i + 4]
+        if all(0 <= c <= 255 for c in (r, g, b)):
+            return rgb_to_hex((r, g, b)), i + 4
+        return None, i + 4
+    return None, len(params)
+
+
+def _param(value: str) -> int:
+    return int(value) if value.isdigit() else 0
+
+
+def sgr_params(raw: str) -> List[int]:
+    """Split SGR parameters, flattening colon forms such as ``38:5:196``."""
+    params: List[int] = []
+    for group in raw.split(";"):
+        if ":" not in group:
+            params.append(_param(group))
+            continue
+        code, *sub = group.split(":")
+        if code in ("38", "48"):
+            if sub[0] == "5" and len(sub) >= 2:
+                params += [int(code), 5, _param(sub[1])]
+            elif sub[0] == "2" and len(sub) >= 4:
+                # `38:2:R:G:B`, or `38:2:ID:R:G:B` with a (often empty) color
+                # space ID.
+                params += [int(code), 2, *map(_param, sub[-3:])]
+        elif code == "4":
+            # Underline styles: `4:0` turns it off, `4:3` is curly, ...
+            params.append(24 if sub[0] == "0" else 4)
+        elif code.isdigit() and code != "58":
+            # Sub-parameters of other codes are ignored, as is underline color.
+            params.append(int(code))
+    return params
+
+
+def apply_sgr(style: Style, raw: str) -> Style:
+    """Return ``style`` updated with the SGR parameter string ``raw``."""
+    params = sgr_params(raw) if raw else [0]
+    state = list(style)
+    i = 0
+    while i < len(params):
+        code = params[i]
+        i += 1
+        if code == 0:
+            state = list(PLAIN)
+        elif 30 <= code <= 37:
+            state[FG] = BASE_PALETTE[code - 30]
+        elif 90 <= code <= 97:
+            state[FG] = BASE_PALETTE[code - 82]
+        elif 40 <= code <= 47:
+            state[BG] = BASE_PALETTE[code - 40]
+        elif 100 <= code <= 107:
+            state[BG] = BASE_PALETTE[code - 92]
+        elif code == 39:
+            state[FG] = None
+        elif code == 49:
+            state[BG] = None
+        elif code in (38, 48):
+            color, i = _extended_color(params, i)
+            if color is not None:
+                state[FG if code == 38 else BG] = color
+        elif code == 22:
+            state[BOLD] = state[DIM] = False
+        elif code in ATTRIBUTES:
+            slot, value = ATTRIBUTES[code]
+            state[slot] = value
+    return tuple(state)  # type: ignore[return-value]
+
+
+class AnsiDecoder:
+    """Incrementally split ANSI text into ``(style, text)`` runs.
+
+    Adjacent text with the same style is merged into one run, escape
+    sequences split across :meth:`feed` calls are carried over, and
+    non-SGR sequences (and a truncated sequence at the very end) are dropped.
+    """
+
+    style: Style
+
+    def __init__(self):
+        self.style = PLAIN
+        self._carry = ""
+        # (style, SGR parameters) -> resulting style. Logs repeat the same few
+        # transitions, so parsing each distinct one once pays off quickly.
+        self._transitions: Dict[Tuple[Style, str], Style] = {}
+
+    def feed(self, text: str) -> Iterator[Tuple[Style, str]]:
+        if self._carry:
+            text = self._carry + text
+            self._carry = ""
+        partial = PARTIAL_RE.search(text, max(0, len(text) - MAX_CARRY))
+        if partial is not None:
+            self._carry = text[partial.start() :]
+            text = text[: partial.start()]
+        style = self.style
+        transitions = self._transitions
+        pending: List[str] = []
+        position = 0
+        for m in SEQ_RE.finditer(text):
+            if m.start() > position:
+                pending.append(text[position : m.start()])
+            position = m.end()
+            if m.group(2) != "m":
+                continue
+            key = (style, m.group(1))
+            new_style = transitions.get(key)
+            if new_style is None:
+                if len(transitions) >= MAX_TRANSITIONS:
+                    transitions.clear()
+                new_style = transitions[key] = apply_sgr(style, m.group(1))
+            if new_style != style:
+                if pending:
+                    yield style, "".join(pending)
+                    pending = []
+                style = new_style
+        if position < len(text):
+            pending.append(text[position:])
+        self.style = style
+        if pending:
+            yield style, "".join(pending)
+
+
+def escape(text: str) -> str:
+    if "&" in text or "<" in text or ">" in text:
+        return html.escape(text, quote=False)
+    return text
+
+
+def style_css(style: Style, svg: bool = False) -> str:
+    fg, bg = style[FG], style[BG]
+    if style[REVERSE]:
+        fg, bg = bg or DEFAULT_BACKGROUND, fg or DEFAULT_FOREGROUND
+    rules: List[str] = []
+    if style[HIDDEN]:
+        rules.append("fill:transparent" if svg else "color:transparent")
+    elif fg:
+        rules.append(f"fill:{fg}" if svg else f"color:{fg}")
+    if bg and not svg:
+        rules.append(f"background-color:{bg}")
+    if style[BOLD]:
+        rules.append("font-weight:bold")
+    if style[DIM]:
+        rules.append("opacity:0.6")
+    if style[ITALIC]:
+        rules.append("font-style:italic")
+    decorations = [
+        name
+        for name, slot in (
+            ("underline", UNDERLINE),
+            ("line-through", STRIKE),
+            ("blink", BLINK),
+        )
+        if style[slot]
+    ]
+    if decorations:
+        rules.append(f"text-decoration:{' '.join(decorations)}")
+    return ";".join(rules)
+
+
+class HtmlWriter:
+    """Write runs as ``<span>`` elements inside a ``<pre>``.
+
+    A span stays open while consecutive runs share its style, so output size
+    scales with the number of style changes, not characters.
+    """
+
+    def __init__(self, output: TextIO, title: str = "ansi-colors"):
+        self.output = output
+        self.title = title
+        self._style: Style = PLAIN
+        self._tags: Dict[Style, str] = {}
+        self._parts: List[str] = []
+
+    def start(self) -> None:
+        profiling.write(
+            self.output,
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{html.escape(self.title)}</title>\n"
+            "<style>\n"
+            f"body {{ background: {DEFAULT_BACKGROUND}; "
+            f"color: {DEFAULT_FOREGROUND}; }}\n"
+            "pre { font-family: ui-monospace, Menlo, Consolas, monospace; }\n"
+            "</style>\n</head>\n<body>\n<pre>",
+        )
+
+    def write(self, style: Style, text: str) -> None:
+        parts = self._parts
+        if style != self._style:
+            if self._style != PLAIN:
+                parts.append("</span>")
+            if style != PLAIN:
+                tag = self._tags.get(style)
+                if tag is None:
+                    if len(self._tags) >= MAX_CACHED_STYLES:
+                        self._tags.clear()
+                    tag = self._tags[style] = f'<span style="{style_css(style)}">'
+                parts.append(tag)
+            self._style = style
+        parts.append(escape(text))
+
+    def flush(self) -> None:
+        profiling.write(self.output, "".join(self._parts))
+        self._parts.clear()
+
+    def finish(self) -> None:
+        if self._style != PLAIN:
+            self._parts.append("</span>")
+        self._parts.append("</pre>\n</body>\n</html>\n")
+        self.flush()
+
+
+class SvgWriter:
+    """Write runs as one ``<text>`` per line with a ``<tspan>`` per style.
+
+    The document height is only known at the end, so it is set from a
+    trailing ``<style>`` element instead of the root attributes. Background
+    colors are not drawn.
+    """
+
+    LINE_HEIGHT = 1.2
+
+    def __init__(self, output: TextIO, title: str = "ansi-colors"):
+        self.output = output
+        self.title = title
+        self._lines = 0
+        self._style: Optional[Style] = None
+        self._css: Dict[Style, str] = {}
+        self._parts: List[str] = []
+
+    def start(self) -> None:
+        profiling.write(
+            self.output,
+            '<svg xmlns="http://www.w3.org/2000/svg" width="100%" '
+            'font-family="ui-monospace, Menlo, Consolas, monospace" font-size="14">\n'
+            f"<title>{html.escape(self.title)}</title>\n"
+            f'<rect width="100%" height="100%" fill="{DEFAULT_BACKGROUND}"/>\n',
+        )
+        self._open_line()
+
+    def _open_line(self) -> None:
+        self._lines += 1
+        self._parts.append(
+            f'<text x="0" y="{self._lines * self.LINE_HEIGHT:.1f}em" '
+            f'fill="{DEFAULT_FOREGROUND}" xml:space="preserve">'
+        )
+        self._style = None
+
+    def _close_span(self) -> None:
+        if self._style is not None:
+            self._parts.append("</tspan>")
+            self._style = None
+
+    def write(self, style: Style, text: str) -> None:
+        lines = text.split("\n")
+        for i, line in enumerate(lines):
+            if i:
+                self._close_span()
+                self._parts.append("</text>\n")
+                self._open_line()
+            if not line:
+                continue
+            css = self._css.get(style)
+            if css is None:
+                if len(self._css) >= MAX_CACHED_STYLES:
+                    self._css.clear()
+                css = self._css[style] = style_css(style, svg=True)
+            if not css:
+                self._close_span()
+            elif style != self._style:
+                self._close_span()
+                self._parts.append(f'<tspan style="{css}">')
+                self._style = style
+            self._parts.append(escape(line))
+
+    def flush(self) -> None:
+        profiling.write(self.output, "".join(self._parts))
+        self._parts.clear()
+
+    def finish(self) -> None:
+        self._close_span()
+        self._parts.append("</text>\n")
+        height = (self._lines + 1) * self.LINE_HEIGHT
+        self._parts.append(
+            f"<style>svg {{ height: {height:.1f}em; }}</style>\n</svg>\n"
+        )
+        self.flush()
+
+
+WRITERS = {"html": HtmlWriter, "svg": SvgWriter}
+
+
+def export(
+    source: BinaryIO,
+    output: TextIO,
+    format: str = "html",
+    title: str = "ansi-colors",
+    read_size: int = READ_SIZE,
+) -> None:
+    """Convert ANSI-colored bytes from ``source`` to HTML or SVG on ``output``.
+
+    Input is read in ``read_size`` chunks and every chunk is written out
+    before the next is read, so memory use does not grow with input size.
+    """
+    try:
+        writer = WRITERS[format](output, title)
+    except KeyError:
+        raise ValueError(f"Invalid format '{format}'. Choose from 'html' or 'svg'.")
+    text_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    ansi = AnsiDecoder()
+    writer.start()
+    while True:
+        chunk = source.read(read_size)
+        text = text_decoder.decode(chunk, final=not chunk)
+        for style, run in ansi.feed(text):
+            writer.write(style, run)
+        writer.flush()
+        if not chunk:
+            break
+    writer.finish()
+
+
+def ansi_to_html(text: str, title: str = "ansi-colors") -> str:
+    """Convert an in-memory string; see :func:`export`."""
+    output = io.StringIO()
+    export(io.BytesIO(text.encode("utf-8")), output, "html", title)
+    return output.getvalue()
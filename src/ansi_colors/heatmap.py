@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+from ansi_colors.codes import (
+    RESET_CODE,
+    FULL_FOREGROUND_COLOR,
+    FULL_BACKGROUND_COLOR,
+    RGB_FOREGROUND_COLOR,
+    RGB_BACKGROUND_COLOR,
+    FullAnsiColor,
+    RGBColor,
+)
+
+DEFAULT_BUCKETS = 256
+
+# 256-color cube indices running green -> yellow -> red.
+GREEN_TO_RED: Tuple[int, ...] = (46, 82, 118, 154, 190, 226, 220, 214, 208, 202, 196)
+# Truecolor stops for the same ramp.
+GREEN_TO_RED_RGB: Tuple[Tuple[int, int, int], ...] = (
+    (0, 200, 0),
+    (255, 215, 0),
+    (220, 0, 0),
+)
+
+
+def _interpolate(
+    stops: Sequence[Tuple[int, int, int]], position: float
+) -> Tuple[int, int, int]:
+    if len(stops) == 1:
+        return stops[0]
+    scaled = position * (len(stops) - 1)
+    lower = min(int(scaled), len(stops) - 2)
+    frac = scaled - lower
+    r0, g0, b0 = stops[lower]
+    r1, g1, b1 = stops[lower + 1]
+    return (
+        round(r0 + (r1 - r0) * frac),
+        round(g0 + (g1 - g0) * frac),
+        round(b0 + (b1 - b0) * frac),
+    )
+
+
+class HeatmapScale:
+    """Map numeric values onto a precomputed table of escape sequences.
+
+    The range ``[low, high]`` is split into equal buckets and every bucket is
+    resolved to its escape sequence once, so mapping a value is a clamp and a
+    single list index. Values outside the range are clamped to the first or
+    last bucket; NaN maps to ``missing``.
+    """
+
+    low: float
+    high: float
+    lut: Tuple[str, ...]
+    missing: str
+
+    def __init__(
+        self,
+        sequences: Sequence[str],
+        low: float,
+        high: float,
+        missing: str = "",
+    ):
+        if not sequences:
+            raise ValueError("A heatmap scale needs at least one color.")
+        if not high > low:
+            raise ValueError("The upper bound must be greater than the lower bound.")
+        self.low = float(low)
+        self.high = float(high)
+        self.lut = tuple(sequences)
+        self.missing = missing
+        self._last = len(self.lut) - 1
+        self._scale = len(self.lut) / (self.high - self.low)
+
+    @classmethod
+    def from_full(
+        cls,
+        indices: Sequence[int],
+        low: float,
+        high: float,
+        background: bool = False,
+    ) -> HeatmapScale:
+        """Build a scale with one bucket per 256-color index."""
+        palette: FullAnsiColor = (
+            FULL_BACKGROUND_COLOR if background else FULL_FOREGROUND_COLOR
+        )
+        return cls([palette.to_ansi(index) for index in indices], low, high)
+
+    @classmethod
+    def from_rgb(
+        cls,
+        stops: Sequence[Tuple[int, int, int]],
+        low: float,
+        high: float,
+        buckets: int = DEFAULT_BUCKETS,
+        background: bool = False,
+    ) -> HeatmapScale:
+        """Build a scale by linearly interpolating between RGB stops."""
+        if not stops:
+            raise ValueError("A heatmap scale needs at least one color.")
+        if buckets < 1:
+            raise ValueError("A heatmap scale needs at least one bucket.")
+        palette: RGBColor = RGB_BACKGROUND_COLOR if background else RGB_FOREGROUND_COLOR
+        denominator = max(buckets - 1, 1)
+        sequences = [
+            palette.to_ansi(_interpolate(stops, i / denominator))
+            for i in range(buckets)
+        ]
+        return cls(sequences, low, high)
+
+    def map(self, value: float) -> str:
+        """Return the escape sequence for a single value."""
+        if value != value:
+            return self.missing
+        # Clamp before scaling: int() of an infinite value raises.
+        if value <= self.low:
+            return self.lut[0]
+        if value >= self.high:
+            return self.lut[self._last]
+        return self.lut[min(int((value - self.low) * self._scale), self._last)]
+
+    def map_many(self, values: Iterable[float]) -> Iterator[str]:
+        """Lazily map a stream of values to escape sequences."""
+        lut = self.lut
+        low = self.low
+        high = self.high
+        scale = self._scale
+        last = self._last
+        missing = self.missing
+        for value in values:
+            if value != value:
+                yield missing
+                continue
+            if value <= low:
+                yield lut[0]
+            elif value >= high:
+                yield lut[last]
+            else:
+                yield lut[min(int((value - low) * scale), last)]
+
+    def map_array(self, values):
+        """Map a whole column at once using NumPy.
+
+        Returns an object array of escape sequences with the same shape as
+        ``values``. Requires NumPy, which is not a hard dependency.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "HeatmapScale.map_array requires numpy; install ansi-colors[numpy]."
+            ) from e
+        arr = np.asarray(values, dtype=np.float64)
+        nan = np.isnan(arr)
+        scaled = np.nan_to_num((arr - self.low) * self._scale, nan=0.0)
+        indices = np.clip(scaled, 0, self._last).astype(np.intp)
+        lut = np.array(self.lut + (self.missing,), dtype=object)
+        indices[nan] = len(self.lut)
+        return lut[indices]
+
+    def colorize(self, value: float, text: Optional[str] = None) -> str:
+        """Return ``text`` (or the value itself) wrapped in its bucket color."""
+        if text is None:
+            text = str(value)
+        sequence = self.map(value)
+        if not sequence:
+            return text
+        return f"{sequence}{text}{RESET_CODE.to_ansi()}"
+
+    def legend(self, width: int = 32, text: str = "█") -> str:
+        """Render a strip of ``width`` cells covering the whole range."""
+        step = (self.high - self.low) / width
+        reset = RESET_CODE.to_ansi()
+        cells = [self.map(self.low + step * (i + 0.5)) + text for i in range(width)]
+        return "".join(cells) + reset
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence
+from ansi_colors.codes import (
+    CUBE_LEVELS,
+    ESCAPE_CODE,
+    END_CODE,
+    RESET_SEQUENCE,
+    FULL_FOREGROUND_COLOR,
+    FULL_BACKGROUND_COLOR,
+    RGB_FOREGROUND_COLOR,
+    RGB_BACKGROUND_COLOR,
+    FullAnsiColor,
+    RGBColor,
+)
+
+UPPER_HALF_BLOCK = "▀"
+# Pixels are packed as 0xRRGGBB; a missing bottom pixel (odd height) uses
+# the terminal's default background.
+NO_PIXEL = -1
+DEFAULT_BACKGROUND = "49"
+# Bound on the per-renderer color -> parameters cache.
+MAX_CACHED_COLORS = 65536
+
+
+def _cube_index(value: int) -> int:
+    if value < 48:
+        return 0
+    if value < 115:
+        return 1
+    return (value - 35) // 40
+
+
+@lru_cache(maxsize=4096)
+def nearest_full(color: int) -> int:
+    """Return the 256-color index closest to a packed ``0xRRGGBB`` color.
+
+    Only the 6x6x6 cube and the grayscale ramp are considered; indices 0-15
+    are usually themed by the terminal and would render unpredictably.
+    """
+    r, g, b = color >> 16, (color >> 8) & 0xFF, color & 0xFF
+    ri, gi, bi = _cube_index(r), _cube_index(g), _cube_index(b)
+    cr, cg, cb = CUBE_LEVELS[ri], CUBE_LEVELS[gi], CUBE_LEVELS[bi]
+    cube_distance = (r - cr) ** 2 + (g - cg) ** 2 + (b - cb) ** 2
+    gray = min(max((r + g + b) // 3 - 3, 0) // 10, 23)
+    level = 8 + 10 * gray
+    gray_distance = (r - level) ** 2 + (g - level) ** 2 + (b - level) ** 2
+    if gray_distance < cube_distance:
+        return 232 + gray
+    return 16 + 36 * ri + 6 * gi + bi
+
+
+def _read_token(stream: BinaryIO) -> bytes:
+    token = b""
+    while True:
+        char = stream.read(1)
+        if not char:
+            break
+        if char == b"#" and not token:
+            while char not in (b"\n", b"\r", b""):
+                char = stream.read(1)
+            continue
+        if char.isspace():
+            if token:
+                break
+            continue
+        token += char
+    return token
+
+
+class Netpbm:
+    """A binary PGM (P5) or PPM (P6) image read one row at a time.
+
+    Only the header is read up front; ``sample`` streams the pixel data, so
+    memory use is bounded by a single source row whatever the image size.
+    """
+
+    stream: BinaryIO
+    width: int
+    height: int
+    maxval: int
+    channels: int
+
+    def __init__(self, stream: BinaryIO):
+        magic = _read_token(stream)
+        if magic not in (b"P5", b"P6"):
+            raise ValueError("Only binary PGM (P5) and PPM (P6) images are supported.")
+        try:
+            self.width = int(_read_token(stream))
+            self.height = int(_read_token(stream))
+            self.maxval = int(_read_token(stream))
+        except ValueError:
+            raise ValueError("Malformed PGM/PPM header.") from None
+        if self.width < 1 or self.height < 1 or not 0 < self.maxval < 65536:
+            raise ValueError("Malformed PGM/PPM header.")
+        self.stream = stream
+        self.channels = 3 if magic == b"P6" else 1
+        self._sample_size = 1 if self.maxval < 256 else 2
+        self._row_size = self.width * self.channels * self._sample_size
+        self._scale: Optional[bytes] = None
+        if self.maxval < 255:
+            self._scale = bytes(
+                min(255, round(v * 255 / self.maxval)) for v in range(256)
+            )
+
+    def _to_8bit(self, row: bytes) -> bytes:
+        if self._sample_size == 2:
+            samples = array("H", row)
+            if sys.byteorder == "little":
+                samples.byteswap()
+            maxval = self.maxval
+            return bytes(min(255, v * 255 // maxval) for v in samples)
+        if self._scale is not None:
+            return row.translate(self._scale)
+        return row
+
+    def _read_row(self) -> bytes:
+        row = self.stream.read(self._row_size)
+        if len(row) < self._row_size:
+            raise ValueError("Unexpected end of image data.")
+        return row
+
+    def sample(self, width: int, height: int) -> Iterator[List[int]]:
+        """Yield ``height`` rows of ``width`` packed pixels, nearest-neighbour."""
+        columns = [(2 * x + 1) * self.width // (2 * width) for x in range(width)]
+        position = 0
+        row = b""
+        for y in range(height):
+            source = (2 * y + 1) * self.height // (2 * height)
+            while position <= source:
+                row = self._read_row()
+                position += 1
+            pixels = self._to_8bit(row)
+            if self.channels == 3:
+                yield [
+                    (pixels[o] << 16) | (pixels[o + 1] << 8) | pixels[o + 2]
+                    for o in [3 * x for x in columns]
+                ]
+            else:
+                yield [pixels[x] * 0x010101 for x in columns]
+
+
+class HalfBlockRenderer:
+    """Render pairs of pixel rows as lines of upper half blocks.
+
+    The top pixel is the foreground and the bottom pixel the background of
+    each cell. A color's SGR parameters are resolved once and cached, and a
+    sequence is only emitted when the foreground or background changes, so
+    runs of identical cells cost a single escape sequence.
+    """
+
+    truecolor: bool
+
+    def __init__(self, truecolor: bool = True):
+        self.truecolor = truecolor
+        self._fg: Dict[int, str] = {}
+        self._bg: Dict[int, str] = {NO_PIXEL: DEFAULT_BACKGROUND}
+
+    def _params(self, color: int, background: bool) -> str:
+        cache = self._bg if background else self._fg
+        params = cache.get(color)
+        if params is None:
+            if len(cache) >= MAX_CACHED_COLORS:
+                cache.clear()
+                if background:
+                    cache[NO_PIXEL] = DEFAULT_BACKGROUND
+            if self.truecolor:
+                rgb: RGBColor = (
+                    RGB_BACKGROUND_COLOR if background else RGB_FOREGROUND_COLOR
+                )
+                # Unpacked bytes are always in range; skip `params` validation.
+                params = (
+                    f"{rgb.code1};{rgb.code2};"
+                    f"{color >> 16};{(color >> 8) & 0xFF};{color & 0xFF}"
+                )
+            else:
+                full: FullAnsiColor = (
+                    FULL_BACKGROUND_COLOR if background else FULL_FOREGROUND_COLOR
+                )
+                params = full.code(nearest_full(color)).code
+            cache[color] = params
+        return params
+
+    def line(self, top: Sequence[int], bottom: Optional[Sequence[int]]) -> str:
+        """Render one line of cells; ``bottom`` is ``None`` for a last odd row."""
+        if bottom is None:
+            bottom = [NO_PIXEL] * len(top)
+        fg_cache, bg_cache, resolve = self._fg, self._bg, self._params
+        parts: List[str] = []
+        fg = bg = ""
+        run = 0
+        for upper, lower in zip(top, bottom):
+            # Compare resolved parameters, not pixels: in 256-color mode many
+            # pixels share an index and should still coalesce.
+            upper_params = fg_cache.get(upper) or resolve(upper, False)
+            lower_params = bg_cache.get(lower) or resolve(lower, True)
+            if upper_params == fg and lower_params == bg:
+                run += 1
+                continue
+            if run:
+                parts.append(UPPER_HALF_BLOCK * run)
+            if upper_params != fg and lower_params != bg:
+                parts.append(f"{ESCAPE_CODE}{upper_params};{lower_params}{END_CODE}")
+            elif upper_params != fg:
+                parts.append(f"{ESCAPE_CODE}{upper_params}{END_CODE}")
+            else:
+                parts.append(f"{ESCAPE_CODE}{lower_params}{END_CODE}")
+            fg, bg = upper_params, lower_params
+            run = 1
+        if run:
+            parts.append(UPPER_HALF_BLOCK * run)
+        # Colors are written whatever the detected support (the encoding is
+        # chosen explicitly), so the reset must be too.
+        parts.append(RESET_SEQUENCE)
+        return "".join(parts)
+
+
+def render_image(image: Netpbm, width: int, truecolor: bool = True) -> Iterator[str]:
+    """Yield the lines of ``image`` scaled to ``width`` cells.
+
+    The height keeps the aspect ratio with two pixels per cell, so lines are
+    produced as soon as their two source rows have been read.
+    """
+    if width < 1:
+        raise ValueError("The image width must be at least one cell.")
+    height = max(1, round(image.height * width / image.width))
+    renderer = HalfBlockRenderer(truecolor)
+    rows = image.sample(width, height)
+    for top in rows:
+        yield renderer.line(top, next(rows, None))
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+from functools import lru_cache
+from string import Formatter
+import re
+from ansi_colors.codes import (
+    ESCAPE_CODE,
+    END_CODE,
+    JOIN_CODE,
+    RESET_CODE,
+    TEXT_STYLES,
+    FOREGROUND_COLORS,
+    ColorTypes,
+    AnsiCodes,
+    ShowCode,
+)
+
+CACHE_SIZE = 1024
+
+# Tags look like ``[bold red]``, ``[/]`` or ``[/bold red]``. Like rich, a tag
+# has to start with a lowercase letter, ``#`` or ``/`` so that text such as
+# ``[INFO]`` or ``[1/3]`` is left alone. ``\[`` escapes a literal bracket.
+TAG_RE = re.compile(r"(\\)?\[([a-z#/][^\[\]]*)\]")
+
+STYLE_NAMES = tuple(TEXT_STYLES.table_attrs.values()) + ("reset",)
+COLOR_NAMES = tuple(FOREGROUND_COLORS.table_attrs.values())
+
+
+def _color_code(token: str, section: ColorTypes) -> ShowCode:
+    if token in COLOR_NAMES:
+        return getattr(section.base, token)
+    if token.startswith("bright_") and token[7:] in COLOR_NAMES:
+        return getattr(section.bright, token[7:])
+    if token.startswith("full:"):
+        try:
+            index = int(token[5:])
+        except ValueError as e:
+            raise ValueError(f"Invalid 256-color index in '{token}'.") from e
+        return section.full.code(index)
+    if token.startswith(("#", "rgb:", "rgb(", "hsl:", "hsl(", "hsv:", "hsv(")):
+        return section.rgb.code(token)
+    raise ValueError(f"Unknown color '{token}'.")
+
+
+def _style_code(token: str, background: bool) -> ShowCode:
+    if token.startswith("fg:"):
+        return _color_code(token[3:], AnsiCodes.foreground)
+    if token.startswith("bg:"):
+        return _color_code(token[3:], AnsiCodes.background)
+    if background:
+        return _color_code(token, AnsiCodes.background)
+    if token in STYLE_NAMES:
+        return getattr(TEXT_STYLES, token)
+    return _color_code(token, AnsiCodes.foreground)
+
+
+def style_codes(spec: str) -> List[ShowCode]:
+    """Resolve a style spec such as ``"bold red on full:52"`` to its codes.
+
+    Tokens are text style names, color names (``red``, ``bright_red``),
+    ``full:N``, ``rgb:r,g,b``, ``#rrggbb`` and ``hsl:h,s,l``. A color after
+    ``on`` (or prefixed with ``bg:``) is a background color; ``fg:`` forces a
+    foreground color.
+    """
+    codes: List[ShowCode] = []
+    background = False
+    for token in spec.lower().split():
+        if token == "on":
+            background = True
+            continue
+        codes.append(_style_code(token, background))
+        background = False
+    if background:
+        raise ValueError(f"Missing background color after 'on' in '{spec}'.")
+    return codes
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def style_params(spec: str) -> str:
+    """Return the SGR parameters of every style in ``spec``, e.g. ``"1;31"``.
+
+    Codes the terminal does not support are dropped (with the usual warning).
+    """
+    params: List[str] = []
+    for code in style_codes(spec):
+        if code.is_supported:
+            params.append(code.code)
+        else:
+            code.to_ansi()
+    return JOIN_CODE.join(params)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def style_sequence(spec: str) -> str:
+    """Return a single escape sequence applying every style in ``spec``."""
+    params = style_params(spec)
+    if not params:
+        return ""
+    return f"{ESCAPE_CODE}{params}{END_CODE}"
+
+
+class Field:
+    name: str
+    conversion: Optional[str]
+    spec: str
+
+    def __init__(self, name: str, conversion: Optional[str], spec: str):
+        self.name = name
+        self.conversion = conversion
+        self.spec = spec
+
+    def format(self, values: dict) -> str:
+        value = values[self.name]
+        if self.conversion == "r":
+            value = repr(value)
+        elif self.conversion == "a":
+            value = ascii(value)
+        elif self.conversion == "s":
+            value = str(value)
+        if self.spec:
+            return format(value, self.spec)
+        return str(value)
+
+
+class Template:
+    """A markup template compiled into precomputed segments.
+
+    ``segments`` holds ``(sequence, literal)`` pairs in output order. Rendering
+    only substitutes the ``{field}`` placeholders into a prebuilt list of
+    strings and joins it.
+    """
+
+    source: str
+    segments: Tuple[Tuple[str, str], ...]
+    fields: Tuple[str, ...]
+
+    def __init__(self, source: str, segments: List[Tuple[str, str]]):
+        self.source = source
+        self.segments = tuple(segments)
+        self._parts: List[str] = []
+        self._slots: List[Tuple[int, Field]] = []
+        formatter = Formatter()
+        for sequence, literal in self.segments:
+            if sequence:
+                self._parts.append(sequence)
+            for text, name, spec, conversion in formatter.parse(literal):
+                if text:
+                    self._parts.append(text)
+                if name is None:
+                    continue
+                if not name:
+                    raise ValueError(
+                        "Positional fields are not supported; name every field."
+                    )
+                field = Field(name, conversion, spec or "")
+                self._slots.append((len(self._parts), field))
+                self._parts.append("")
+        self.fields = tuple(dict.fromkeys(field.name for _, field in self._slots))
+        self._static = "".join(self._parts) if not self._slots else None
+
+    def __repr__(self) -> str:
+        return f"Template({self.source!r})"
+
+    def render(self, **values: Any) -> str:
+        if self._static is not None:
+            return self._static
+        parts = self._parts.copy()
+        for index, field in self._slots:
+            parts[index] = field.format(values)
+        return "".join(parts)
+
+    __call__ = render
+
+
+def _escape_literal(text: str) -> str:
+    return text.replace("\\[", "[")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_markup(source: str) -> Template:
+    """Parse ``source`` once and return its cached :class:`Template`.
+
+    ``[style]`` opens a style, ``[/]`` closes the innermost one and
+    ``[/style]`` closes the innermost matching one. Unclosed styles are
+    reset at the end of the template. Literal text may contain ``{name}``
+    placeholders (use ``{{`` and ``}}`` for literal braces).
+    """
+    reset = RESET_CODE.to_ansi()
+    segments: List[Tuple[str, str]] = []
+    stack: List[Tuple[str, str]] = []
+    pending = ""
+    literal = ""
+    position = 0
+    for m in TAG_RE.finditer(source):
+        literal += _escape_literal(source[position : m.start()])
+        position = m.end()
+        tag = m.group(2)
+        if m.group(1):
+            literal += f"[{tag}]"
+            continue
+        if literal:
+            segments.append((pending, literal))
+            pending = literal = ""
+        if tag.startswith("/"):
+            name = tag[1:].strip()
+            if not stack:
+                raise ValueError(f"Closing tag '[{tag}]' has nothing to close.")
+            if name:
+                for i in range(len(stack) - 1, -1, -1):
+                    if stack[i][0] == name:
+                        del stack[i]
+                        break
+                else:
+                    raise ValueError(
+                        f"Closing tag '[{tag}]' does not match any open tag."
+                    )
+            else:
+                stack.pop()
+            pending = reset + "".join(sequence for _, sequence in stack)
+        else:
+            name = tag.strip()
+            sequence = style_sequence(name)
+            stack.append((name, sequence))
+            pending += sequence
+    literal += _escape_literal(source[position:])
+    if literal:
+        segments.append((pending, literal))
+        pending = ""
+    if stack:
+        pending = reset
+    if pending:
+        segments.append((pending, ""))
+    return Template(source, segments)
+
+
+def render(source: str, **values: Any) -> str:
+    """Compile (or fetch from cache) ``source`` and render it."""
+    return compile_markup(source).render(**values)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import IO, AnyStr, Dict, Iterator, List, Optional
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+# Import timing is recorded unconditionally: two clock reads per process.
+IMPORT_STARTED: float = perf_counter()
+IMPORT_FINISHED: Optional[float] = None
+# Set by `supports_color()` the first (and only) time it runs.
+DETECTION_SECONDS: Optional[float] = None
+
+PHASES = ("import", "detect", "tables", "render", "write")
+COUNTERS = (
+    "sequences_emitted",
+    "bytes_written",
+    "showcode_allocated",
+    "warnings_suppressed",
+)
+
+_NULL = nullcontext()
+
+
+class Profiler:
+    """Collects per-phase timings and hot-path counters.
+
+    Phase timings are exclusive: entering a phase pauses the enclosing one,
+    so the numbers add up to the time spent inside instrumented code. A
+    profiler is meant to be driven from one thread at a time.
+    """
+
+    timings: Dict[str, float]
+    counters: Dict[str, int]
+
+    def __init__(self):
+        self.timings = {name: 0.0 for name in PHASES}
+        self.counters = {name: 0 for name in COUNTERS}
+        self._stack: List[List] = []
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def time(self, phase: str) -> Iterator[None]:
+        now = perf_counter()
+        if self._stack:
+            outer = self._stack[-1]
+            self.timings[outer[0]] += now - outer[1]
+        frame = [phase, now]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            now = perf_counter()
+            self._stack.pop()
+            self.timings[phase] = self.timings.get(phase, 0.0) + now - frame[1]
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def report(self) -> str:
+        timings = dict(self.timings)
+        if IMPORT_FINISHED is not None:
+            timings["import"] = IMPORT_FINISHED - IMPORT_STARTED
+        if DETECTION_SECONDS is not None:
+            timings["detect"] = DETECTION_SECONDS
+        lines = ["Profile:"]
+        for name, seconds in timings.items():
+            lines.append(f"  {name:<20} {seconds * 1000:>10.3f} ms")
+        for name, value in self.counters.items():
+            lines.append(f"  {name.replace('_', ' '):<20} {value:>10}")
+        return "\n".join(lines)
+
+
+# The active profiler, if any. Instrumented code checks this for `None`
+# before doing anything else, which is all profiling costs when disabled.
+ACTIVE: Optional[Profiler] = None
+
+
+def start() -> Profiler:
+    """Enable profiling for the rest of the process and return the profiler."""
+    global ACTIVE
+    ACTIVE = Profiler()
+    return ACTIVE
+
+
+def stop() -> None:
+    global ACTIVE
+    ACTIVE = None
+
+
+@contextmanager
+def profile() -> Iterator[Profiler]:
+    """Enable profiling for the duration of the block and yield the profiler.
+
+    The profiler is process-wide and its counters are not synchronised, so
+    this is not meant for concurrent use: profile one thread or task at a
+    time, and do not nest ``profile()`` blocks from different threads.
+    """
+    global ACTIVE
+    previous = ACTIVE
+    ACTIVE = Profiler()
+    try:
+        yield ACTIVE
+    finally:
+        ACTIVE = previous
+
+
+def phase(name: str):
+    """Time a block as ``name`` if profiling is enabled."""
+    if ACTIVE is None:
+        return _NULL
+    return ACTIVE.time(name)
+
+
+def write(stream: IO[AnyStr], data: AnyStr) -> None:
+    """Write ``data`` to ``stream``, timed and counted if profiling is enabled.
+
+    Text is counted as UTF-8; every ESC written counts as one sequence.
+    """
+    if ACTIVE is None:
+        stream.write(data)
+        return
+    with ACTIVE.time("write"):
+        stream.write(data)
+    raw = data.encode() if isinstance(data, str) else data
+    ACTIVE.count("bytes_written", len(raw))
+    ACTIVE.count("sequences_emitted", raw.count(b"\x1b"))
+
+
+def mark_imported() -> None:
+    global IMPORT_FINISHED
+    if IMPORT_FINISHED is None:
+        IMPORT_FINISHED = perf_counter()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import re
+from typing import List, Optional, Sequence, Tuple
+
+# Leading global flags such as ``(?i)``; they are only valid at the very start
+# of a pattern, so they are rewritten into a scoped group before joining.
+GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
+PASSTHROUGH_GROUP = "_passthrough"
+
+
+def group_name(index: int) -> str:
+    """Return the name of the group rule ``index`` is compiled into."""
+    return f"_rule{index}"
+
+
+def parse_rules(specs: Sequence[str]) -> List[Tuple[str, str]]:
+    """Split ``PATTERN=STYLE`` strings into ``(pattern, style)`` pairs.
+
+    The last ``=`` separates the two, so patterns may contain ``=``.
+    """
+    rules: List[Tuple[str, str]] = []
+    for spec in specs:
+        pattern, sep, style = spec.rpartition("=")
+        if not sep or not pattern or not style.strip():
+            raise ValueError(f"Invalid rule '{spec}'. Expected PATTERN=STYLE.")
+        rules.append((pattern, style))
+    return rules
+
+
+def _scoped(pattern: str) -> str:
+    m = GLOBAL_FLAGS_RE.match(pattern)
+    if m is None:
+        return pattern
+    rest = pattern[m.end() :]
+    # A verbose pattern may end in a comment, which would swallow the `)`.
+    end = "\n)" if "x" in m.group(1) else ")"
+    return f"(?{m.group(1)}:{rest}{end}"
+
+
+def _has_numbered_reference(pattern: str) -> bool:
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            if not in_class and pattern[i + 1 : i + 2] in tuple("123456789"):
+                return True
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A `]` right after `[` or `[^` is a literal member.
+            if pattern[i + 1 : i + 2] == "^":
+                i += 1
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1
+        elif pattern.startswith("(?(", i) and pattern[i + 3 : i + 4].isdigit():
+            return True
+        i += 1
+    return False
+
+
+def compile_rules(
+    patterns: Sequence[str], flags: int = 0, passthrough: Optional[str] = None
+) -> re.Pattern:
+    """Compile ``patterns`` into one alternation, rule ``i`` in ``group_name(i)``.
+
+    Leading global flags like ``(?i)`` only apply to their own rule. Because
+    every rule is wrapped in a group, numbered backreferences would point at
+    the wrong group; they are rejected, and named groups work instead.
+
+    A ``passthrough`` pattern is tried before the rules, as the group
+    ``PASSTHROUGH_GROUP``, for text that callers should leave untouched.
+    """
+    alternatives: List[str] = []
+    if passthrough is not None:
+        alternatives.append(f"(?P<{PASSTHROUGH_GROUP}>{passthrough})")
+    for i, pattern in enumerate(patterns):
+        scoped = _scoped(pattern)
+        try:
+            re.compile(scoped, flags)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern '{pattern}': {e}") from e
+        if _has_numbered_reference(pattern):
+            raise ValueError(
+                f"Invalid pattern '{pattern}': numbered backreferences are not "
+                "supported, use a named group and (?P=name) instead."
+            )
+        alternatives.append(f"(?P<{group_name(i)}>{scoped})")
+    try:
+        return re.compile("|".join(alternatives), flags)
+    except re.error as e:
+        raise ValueError(f"Invalid rules: {e}") from e
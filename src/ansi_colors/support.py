@@ -8,6 +8,8 @@ import re
 import platform
 from ansi_colors.utils import warn, debug, info
 from functools import lru_cache
+from time import perf_counter
+from ansi_colors import profiling
 
 
 class ColorSupport(Enum):
@@ -128,8 +130,15 @@ def match(name: str, strs: List[str], patterns: List[Pattern]) -> bool:
 @lru_cache()
 def supports_color() -> ColorSupport:
     """
-    Returns True if the running system's terminal supports color, and False otherwise.
+    Returns the level of color support of the running system's terminal.
     """
+    started = perf_counter()
+    support = _detect_color_support()
+    profiling.DETECTION_SECONDS = perf_counter() - started
+    return support
+
+
+def _detect_color_support() -> ColorSupport:
     plat = sys.platform
     plat_name = platform.system().lower()
     support = ColorSupport.NO_COLOR
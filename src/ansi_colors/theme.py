@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+from typing import Any, Dict, Iterator, Optional, Tuple
+from ansi_colors import profiling
+from ansi_colors.codes import RESET_SEQUENCE
+from ansi_colors.support import supports_color
+from ansi_colors.utils import debug
+
+# Bumped whenever the layout of a cache file changes.
+CACHE_VERSION = 1
+THEME_ENV = "ANSI_COLORS_THEME"
+CACHE_ENV = "ANSI_COLORS_CACHE_DIR"
+
+
+def _toml():
+    if sys.version_info >= (3, 11):
+        import tomllib
+
+        return tomllib
+    try:
+        import tomli
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "Theme files require tomli to be installed on Python 3.10."
+        ) from e
+    return tomli
+
+
+def theme_path() -> str:
+    """Return the shared theme file: ``$ANSI_COLORS_THEME`` or the XDG config."""
+    path = os.environ.get(THEME_ENV)
+    if path:
+        return path
+    config = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return os.path.join(config, "ansi-colors", "theme.toml")
+
+
+def cache_dir() -> str:
+    """Return the directory compiled themes are stored in."""
+    path = os.environ.get(CACHE_ENV)
+    if path:
+        return path
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache, "ansi-colors")
+
+
+class Theme:
+    """Named styles resolved to ready-to-write escape sequences.
+
+    ``specs`` keeps the style specs as written in the theme file and
+    ``sequences`` the escape sequence each one compiles to for the detected
+    color support level.
+    """
+
+    path: str
+    specs: Dict[str, str]
+    sequences: Dict[str, str]
+
+    def __init__(self, path: str, specs: Dict[str, str], sequences: Dict[str, str]):
+        self.path = path
+        self.specs = specs
+        self.sequences = sequences
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sequences
+
+    def __getitem__(self, name: str) -> str:
+        try:
+            return self.sequences[name]
+        except KeyError:
+            raise KeyError(f"Theme has no style named '{name}'.") from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sequences)
+
+    def __len__(self) -> int:
+        return len(self.sequences)
+
+    def get(self, name: str, default: str = "") -> str:
+        return self.sequences.get(name, default)
+
+    def style(self, name: str, text: str) -> str:
+        """Wrap ``text`` in the named style, resetting afterwards."""
+        sequence = self[name]
+        if not sequence:
+            return text
+        return f"{sequence}{text}{RESET_SEQUENCE}"
+
+    @classmethod
+    def parse(cls, source: str, path: str = "<string>") -> Theme:
+        """Parse and resolve theme source without touching the cache."""
+        return cls(path, *_compile(source, path))
+
+
+def _specs(data: Dict[str, Any], path: str) -> Dict[str, str]:
+    table = data.get("styles", data)
+    if not isinstance(table, dict):
+        raise ValueError(f"'styles' in {path} must be a table.")
+    specs: Dict[str, str] = {}
+    for name, spec in table.items():
+        if not isinstance(spec, str):
+            raise ValueError(f"Style '{name}' in {path} must be a string.")
+        specs[name] = spec
+    return specs
+
+
+def _compile(source: str, path: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    from ansi_colors.markup import style_sequence
+
+    toml = _toml()
+    try:
+        data = toml.loads(source)
+    except toml.TOMLDecodeError as e:
+        raise ValueError(f"Invalid theme file {path}: {e}") from e
+    specs = _specs(data, path)
+    sequences: Dict[str, str] = {}
+    with profiling.phase("tables"):
+        for name, spec in specs.items():
+            try:
+                sequences[name] = style_sequence(spec)
+            except ValueError as e:
+                raise ValueError(f"Invalid style '{name}' in {path}: {e}") from e
+    return specs, sequences
+
+
+def _cache_file(path: str, support: int) -> str:
+    key = hashlib.sha256(f"{path}\0{support}".encode()).hexdigest()[:32]
+    return os.path.join(cache_dir(), f"{key}.marshal")
+
+
+def _read_cache(cache_file: str) -> Optional[tuple]:
+    try:
+        with open(cache_file, "rb") as f:
+            entry = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, tuple) or len(entry) != 7 or entry[0] != CACHE_VERSION:
+        return None
+    return entry
+
+
+def _write_cache(cache_file: str, entry: tuple) -> None:
+    tmp = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(marshal.dumps(entry))
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        debug(f"Could not write theme cache {cache_file}: {e}")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def load_theme(path: Optional[str] = None, use_cache: bool = True) -> Theme:
+    """Load a TOML theme, compiling it only when the cached copy is stale.
+
+    The cache is keyed by the theme's path and the detected color support
+    level. An entry whose modification time and size match is used as is;
+    otherwise the file's SHA-256 decides whether it really changed, so a
+    touched but identical theme is not recompiled.
+    """
+    path = os.path.abspath(path or theme_path())
+    stat = os.stat(path)
+    support = supports_color().value
+    cache_file = _cache_file(path, support)
+    entry = _read_cache(cache_file) if use_cache else None
+    if entry is not None and entry[1] == stat.st_mtime_ns and entry[2] == stat.st_size:
+        return Theme(path, entry[5], entry[6])
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    if entry is not None and entry[3] == digest and entry[4] == support:
+        specs, sequences = entry[5], entry[6]
+    else:
+        debug(f"Compiling theme {path}")
+        specs, sequences = _compile(raw.decode("utf-8"), path)
+    if use_cache:
+        entry = (
+            CACHE_VERSION,
+            stat.st_mtime_ns,
+            stat.st_size,
+            digest,
+            support,
+            specs,
+            sequences,
+        )
+        _write_cache(cache_file, entry)
+    return Theme(path, specs, sequences)
@@ -1,10 +1,36 @@
 from __future__ import annotations
 
 from enum import IntEnum
-from rich.console import Console
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Optional
+from ansi_colors import profiling
 
-console = Console(soft_wrap=True)
-msgs = []
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Created on first use: importing rich costs more than most commands take,
+# and most runs never log anything.
+_console: Optional[Console] = None
+# Messages already shown. Membership is checked without the lock; the lock
+# only serialises the first time a message is recorded.
+msgs: set = set()
+_msgs_lock = Lock()
+
+
+def get_console() -> Console:
+    """Return the shared console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console(soft_wrap=True)
+    return _console
+
+
+def __getattr__(name: str) -> Any:
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class LogLevel(IntEnum):
@@ -35,6 +61,16 @@ class LogStore:
         self.value = value
 
 
+def _first_time(message: str) -> bool:
+    if message in msgs:
+        return False
+    with _msgs_lock:
+        if message in msgs:
+            return False
+        msgs.add(message)
+        return True
+
+
 global log_level
 log_level = LogStore(LogLevel.WARNING)
 
@@ -53,10 +89,11 @@ def warn(message: str) -> None:
     Args:
         message (str): The warning message to display.
     """
-    if message in msgs or log_level.value <= LogLevel.WARNING:
+    if log_level.value <= LogLevel.WARNING or not _first_time(message):
+        if profiling.ACTIVE is not None:
+            profiling.ACTIVE.count("warnings_suppressed")
         return
-    console.log(f"[bold yellow]Warning:[/bold yellow] {message}")
-    msgs.append(message)
+    get_console().log(f"[bold yellow]Warning:[/bold yellow] {message}")
 
 
 def info(message: str) -> None:
@@ -65,10 +102,9 @@ def info(message: str) -> None:
     Args:
         message (str): The informational message to display.
     """
-    if message in msgs or log_level.value <= LogLevel.INFO:
+    if log_level.value <= LogLevel.INFO or not _first_time(message):
         return
-    console.log(f"[bold blue]Info:[/bold blue] {message}")
-    msgs.append(message)
+    get_console().log(f"[bold blue]Info:[/bold blue] {message}")
 
 
 def error(message: str) -> None:
@@ -77,10 +113,9 @@ def error(message: str) -> None:
     Args:
         message (str): The error message to display.
     """
-    if message in msgs or log_level.value <= LogLevel.ERROR:
+    if log_level.value <= LogLevel.ERROR or not _first_time(message):
         return
-    console.log(f"[bold red]Error:[/bold red] {message}")
-    msgs.append(message)
+    get_console().log(f"[bold red]Error:[/bold red] {message}")
 
 
 def debug(message: str) -> None:
@@ -89,7 +124,6 @@ def debug(message: str) -> None:
     Args:
         message (str): The debug message to display.
     """
-    if message in msgs or log_level.value <= LogLevel.DEBUG:
+    if log_level.value <= LogLevel.DEBUG or not _first_time(message):
         return
-    console.log(f"[dim][cyan]Debug:[/cyan] {message}[/dim]")
-    msgs.append(message)
+    get_console().log(f"[dim][cyan]Debug:[/cyan] {message}[/dim]")
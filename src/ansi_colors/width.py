@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import List
+from functools import lru_cache
+import re
+import unicodedata
+
+CACHE_SIZE = 4096
+
+# An escape sequence: CSI such as SGR, OSC such as hyperlinks, an nF escape
+# such as the charset selection `ESC ( B` that `tput sgr0` emits, or a
+# two-character escape.
+ESCAPE_PATTERN = (
+    r"\x1b\[[0-?]*[ -/]*[@-~]"
+    r"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)?"
+    r"|\x1b[ -/]+[0-~]"
+    r"|\x1b[@-Z\\-_]?"
+)
+# One scanner for everything: group 1 matches an escape sequence, group 2 a
+# run of printable text.
+TOKEN_RE = re.compile(f"({ESCAPE_PATTERN})" r"|([^\x1b]+)")
+
+RESET = "\x1b[0m"
+ELLIPSIS = "…"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def char_width(char: str) -> int:
+    """Return the number of terminal cells ``char`` occupies (0, 1 or 2)."""
+    if char < " " or "\x7f" <= char < "\xa0":
+        return 0
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+def _text_width(text: str) -> int:
+    if text.isascii() and text.isprintable():
+        return len(text)
+    return sum(map(char_width, text))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def visible_width(text: str) -> int:
+    """Return the number of cells ``text`` occupies once escapes are rendered."""
+    if "\x1b" not in text:
+        return _text_width(text)
+    width = 0
+    for m in TOKEN_RE.finditer(text):
+        if m.group(2) is not None:
+            width += _text_width(m.group(2))
+    return width
+
+
+def strip_ansi(text: str) -> str:
+    """Remove every escape sequence from ``text``."""
+    if "\x1b" not in text:
+        return text
+    return "".join(m.group(2) for m in TOKEN_RE.finditer(text) if m.group(2))
+
+
+def ljust(text: str, width: int, fillchar: str = " ") -> str:
+    padding = width - visible_width(text)
+    if padding <= 0:
+        return text
+    return text + fillchar * padding
+
+
+def rjust(text: str, width: int, fillchar: str = " ") -> str:
+    padding = width - visible_width(text)
+    if padding <= 0:
+        return text
+    return fillchar * padding + text
+
+
+def center(text: str, width: int, fillchar: str = " ") -> str:
+    padding = width - visible_width(text)
+    if padding <= 0:
+        return text
+    front = padding // 2
+    return fillchar * front + text + fillchar * (padding - front)
+
+
+def truncate(text: str, width: int, ellipsis: str = ELLIPSIS) -> str:
+    """Shorten ``text`` to at most ``width`` visible cells.
+
+    Escape sequences are kept intact, the cut is marked with ``ellipsis``
+    and a reset is appended if the kept part contains any escapes.
+    """
+    if visible_width(text) <= width:
+        return text
+    budget = width - visible_width(ellipsis)
+    if budget < 0:
+        return ellipsis[:width]
+    parts: List[str] = []
+    styled = False
+    used = 0
+    for m in TOKEN_RE.finditer(text):
+        sequence, chunk = m.groups()
+        if sequence is not None:
+            parts.append(sequence)
+            styled = True
+            continue
+        chunk_width = _text_width(chunk)
+        if used + chunk_width <= budget:
+            parts.append(chunk)
+            used += chunk_width
+            continue
+        for char in chunk:
+            w = char_width(char)
+            if used + w > budget:
+                break
+            parts.append(char)
+            used += w
+        break
+    parts.append(ellipsis)
+    if styled:
+        parts.append(RESET)
+    return "".join(parts)